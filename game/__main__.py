@@ -9,10 +9,13 @@
 # Make exit hole location permanent for each game session
 
 
+import argparse
 import arcade
 import game.constants as c
-from game.sprites import Player
-from game.views.game_view import GameView
+from game.profiler import StartupProfile
+from game.rng import RandomStreams
+from game.views.splash_view import SplashView
+import time
 
 
 class Window(arcade.Window):
@@ -21,9 +24,11 @@ class Window(arcade.Window):
     """
     def __init__(self, width, height, title):
         super().__init__(width, height, title)
+        self.set_update_rate(1 / c.MAX_FPS)  # game speed is set by steps
 
         self.views = {}
-        self.player = Player()  # load player in window class so all sections/views can share
+        self.rng = RandomStreams(c.RANDOM_SEED)  # all gameplay randomness
+        self.player = None  # shared by all sections/views, see load_game
 
         # TODO: implement arcade "resources" in rest of project
         arcade.resources.add_resource_handle("sprites", "assets/sprites")
@@ -35,12 +40,98 @@ class Window(arcade.Window):
         self.show_view(view)
 
 
-def main():
-    window = Window(c.SCREEN_WIDTH, c.SCREEN_HEIGHT, c.GAME_TITLE)
+def timed_steps(steps, profile: StartupProfile, phase_of):
+    """
+    Runs steps one at a time, adding the time each takes to the phase
+    named by phase_of() as it starts
+    """
+    while True:
+        phase = phase_of()
+        start = time.perf_counter()
+        try:
+            next(steps)
+        except StopIteration:
+            return
+        finally:
+            profile.add(phase, time.perf_counter() - start)
+        yield
+
+
+def load_game(window: Window, args, profile: StartupProfile):
+    """
+    Loads the game behind the splash screen, a piece per step (yielding
+    what's loading next). Returns the game view, set up on its first level
+    """
+    profile.mark("splash shown")
+
+    with profile.phase("deferred imports"):
+        from game.views.game_view import GameView
+        from game.backgrounds import build_background_tiles
+        from game.replay import Recording
+        from game.sprites import Player
+    yield "Loading sprites"
+
+    with profile.phase("assets"):
+        build_background_tiles()  # no-op unless a scrolling map changed
+    yield
+    with profile.phase("assets"):
+        window.player = Player()
+    yield "Building the hive"
+
     view = GameView()
-    view.setup()
-    window.change_view(view)
+    level_name = "home"
+    if args.replay:
+        recording = Recording.load(args.replay)
+        window.rng.reseed(recording.seed)
+        view.play(recording)
+        level_name = recording.start_level
+    elif args.record:
+        view.record(Recording(window.rng.seed))
+
+    # Level's textures and sounds, then its sprites, a step at a time
+    view.prepare_level(level_name)
+    yield from timed_steps(
+        view.prepared[2], profile,
+        lambda: "setup" if view.assets_loaded(level_name) else "assets")
+    with profile.phase("setup"):
+        view.setup(level_name)
+    return view
+
+
+def main():
+    parser = argparse.ArgumentParser(description=c.GAME_TITLE)
+    parser.add_argument("--record", metavar="FILE",
+                        help="save the session's seed and key presses")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play back a session saved with --record")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print time spent importing, loading assets "
+                             "and setting up the first level, then exit")
+    args = parser.parse_args()
+
+    # arcade is imported at the top (constants.py needs it), before any
+    # timer could start: count the CPU time used so far (interpreter start
+    # and those imports) instead, labelled as such as every other phase is
+    # wall-clock time. Later imports are deferred and timed
+    profile = StartupProfile()
+    profile.add("eager imports (CPU time)", time.process_time())
+    with profile.phase("window"):
+        window = Window(c.SCREEN_WIDTH, c.SCREEN_HEIGHT, c.GAME_TITLE)
+
+    def on_loaded(view: arcade.View):
+        profile.mark("first level ready")
+        window.change_view(view)
+        if args.profile_startup:
+            print(profile.report())
+            print(f"(splash target {c.SPLASH_TARGET * 1000:.0f}ms)")
+            window.close()
+
+    window.change_view(SplashView(load_game(window, args, profile),
+                                  on_loaded))
     window.run()
+    view = window.views.get("game_view")
+    if args.record and view:
+        view.save_recording(args.record)
 
 
 if __name__ == "__main__":
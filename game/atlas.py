@@ -0,0 +1,154 @@
+import arcade
+import game.constants as c
+import glob
+import hashlib
+import json
+import os
+from PIL import Image
+from game.loader import executor
+
+
+ATLAS_VERSION = 1  # bump to force a rebuild if the index format changes
+
+
+def file_sha1(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def fingerprint_sources(paths: list, previous: dict = None) -> dict:
+    """
+    Returns {path: {"mtime": ..., "sha1": ...}} for each source file.
+    Files whose mtime matches the previous fingerprint aren't re-hashed.
+    """
+    previous = previous or {}
+    fingerprint = {}
+    for path in paths:
+        mtime = os.path.getmtime(path)
+        old = previous.get(path)
+        if old and old["mtime"] == mtime:
+            fingerprint[path] = old
+        else:
+            fingerprint[path] = {"mtime": mtime, "sha1": file_sha1(path)}
+    return fingerprint
+
+
+def sources_changed(paths: list, previous: dict) -> bool:
+    """Whether any source was added, removed or had its contents changed"""
+    if set(paths) != set(previous):
+        return True
+    current = fingerprint_sources(paths, previous)
+    return any(current[path]["sha1"] != previous[path]["sha1"]
+               for path in paths)
+
+
+def read_index(index_path: str):
+    """Returns the stored atlas index, or None if missing/unreadable"""
+    try:
+        with open(index_path) as index_file:
+            index = json.load(index_file)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != ATLAS_VERSION:
+        return None
+    return index
+
+
+def pack_rects(sizes: list, page_size: int, padding: int = 1) -> list:
+    """
+    Shelf-packs (width, height) rects onto square pages of page_size.
+    Returns a (page, x, y) placement for each rect, in the order given.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    placements = [None] * len(sizes)
+    page, x, y, shelf_height = 0, padding, padding, 0
+    for i in order:
+        width, height = sizes[i]
+        if width + 2 * padding > page_size or \
+                height + 2 * padding > page_size:
+            raise ValueError(f"{width}x{height} image too big for atlas")
+        if x + width + padding > page_size:  # start a new shelf
+            x = padding
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height + padding > page_size:  # start a new page
+            page += 1
+            x, y, shelf_height = padding, padding, 0
+        placements[i] = (page, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+
+def build_atlas(sources: list = None, atlas_dir: str = c.ATLAS_DIR,
+                force: bool = False) -> dict:
+    """
+    Packs the sprite images into atlas page(s) and writes an index of where
+    each image is. Only rebuilds if a source image changed since last build.
+    Returns the index.
+    """
+    if sources is None:
+        sources = sorted(glob.glob(os.path.join(c.SPRITES_DIR, "*.png")))
+    index_path = os.path.join(atlas_dir, c.ATLAS_INDEX)
+    index = read_index(index_path)
+    pages_exist = index and all(
+        os.path.exists(os.path.join(atlas_dir, page))
+        for page in index["pages"])
+    if not force and pages_exist and \
+            not sources_changed(sources, index["sources"]):
+        return index
+
+    images = list(executor().map(decode_image, sources))
+    placements = pack_rects([image.size for image in images],
+                            c.ATLAS_PAGE_SIZE)
+    page_count = max((page for page, _, _ in placements), default=-1) + 1
+    pages = [Image.new("RGBA", (c.ATLAS_PAGE_SIZE, c.ATLAS_PAGE_SIZE))
+             for _ in range(page_count)]
+
+    regions = {}
+    for path, image, (page, x, y) in zip(sources, images, placements):
+        pages[page].paste(image, (x, y))
+        regions[path] = {"page": page, "x": x, "y": y,
+                         "width": image.width, "height": image.height}
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    page_names = []
+    for number, page_image in enumerate(pages):
+        page_name = f"sprites_{number}.png"
+        page_image.save(os.path.join(atlas_dir, page_name))
+        page_names.append(page_name)
+
+    index = {"version": ATLAS_VERSION,
+             "sources": fingerprint_sources(sources),
+             "pages": page_names,
+             "regions": regions}
+    with open(index_path, "w") as index_file:
+        json.dump(index, index_file, indent=1)
+    return index
+
+
+def decode_image(path: str) -> Image.Image:
+    """Reads and decodes an image (safe to run on a worker thread)"""
+    return Image.open(path).convert("RGBA")
+
+
+def load_atlas_textures(atlas_dir: str = c.ATLAS_DIR) -> dict:
+    """
+    Builds the atlas if needed, then returns {source path: texture} with
+    every texture cut from the (once decoded) atlas page images
+    """
+    index = build_atlas(atlas_dir=atlas_dir)
+    pages = list(executor().map(
+        decode_image, [os.path.join(atlas_dir, page)
+                       for page in index["pages"]]))
+    textures = {}
+    for path, region in index["regions"].items():
+        x, y = region["x"], region["y"]
+        image = pages[region["page"]].crop(
+            (x, y, x + region["width"], y + region["height"]))
+        textures[path] = arcade.Texture(path, image=image)
+    return textures
+
+
+if __name__ == "__main__":
+    build_atlas(force=True)
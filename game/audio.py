@@ -0,0 +1,55 @@
+import arcade
+import game.constants as c
+from game.loader import AssetLoader
+
+
+# Short sound effects, decoded once (on a worker thread) and shared by every
+# section. Nothing to do on the main thread once decoded
+_sounds = AssetLoader(lambda name: arcade.load_sound(c.SOUNDS[name]),
+                      lambda name, sound: sound)
+
+# Streaming background music, kept playing across level changes
+_music = None
+_music_player = None
+
+
+def load_sound(name: str) -> arcade.Sound:
+    """Returns sound effect by name (see constants.SOUNDS), loading once"""
+    return _sounds.get(name)
+
+
+def request_sounds(names: list) -> list:
+    """Start decoding sound effects on worker threads, returns futures"""
+    return _sounds.request_all(names)
+
+
+def sounds_loaded(names: list) -> bool:
+    _sounds.finish_ready()
+    return _sounds.loaded(names)
+
+
+def preload_sounds() -> None:
+    request_sounds(list(c.SOUNDS))
+    for name in c.SOUNDS:
+        load_sound(name)
+
+
+def play_sound(name: str):
+    return arcade.play_sound(load_sound(name))
+
+
+def play_music() -> None:
+    """Start looping background music (if not already playing)"""
+    global _music, _music_player
+    if _music_player is not None:
+        return
+    if _music is None:
+        _music = arcade.load_sound(c.BACKGROUND_MUSIC, streaming=True)
+    _music_player = arcade.play_sound(_music, looping=True)
+
+
+def stop_music() -> None:
+    global _music_player
+    if _music_player is not None:
+        arcade.stop_sound(_music_player)
+        _music_player = None
@@ -0,0 +1,250 @@
+import arcade
+import game.constants as c
+from game.atlas import fingerprint_sources, sources_changed, decode_image
+from game.loader import executor
+import json
+import os
+from PIL import Image
+
+
+TILES_VERSION = 1  # bump to force a re-slice if the index format changes
+
+
+def tiles_dir_for(image_path: str) -> str:
+    name = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(c.TILES_DIR, name)
+
+
+def read_tiles_index(tiles_dir: str):
+    """Returns the stored tile index, or None if missing/unreadable"""
+    try:
+        with open(os.path.join(tiles_dir, c.TILES_INDEX)) as index_file:
+            index = json.load(index_file)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != TILES_VERSION:
+        return None
+    return index
+
+
+def slice_background(image_path: str, width: int = c.MAIN_VIEW_WIDTH,
+                     tile_height: int = c.BACKGROUND_TILE_HEIGHT,
+                     force: bool = False) -> dict:
+    """
+    Cuts a tall background into tiles of tile_height (numbered from the
+    bottom of the image up, the top tile may be shorter) so it can be
+    streamed in while scrolling. Only re-slices if the image changed.
+    Returns the tile index.
+    """
+    tiles_dir = tiles_dir_for(image_path)
+    index = read_tiles_index(tiles_dir)
+    if not force and index \
+            and index["width"] == width \
+            and index["tile_height"] == tile_height \
+            and all(os.path.exists(os.path.join(tiles_dir, tile))
+                    for tile in index["tiles"]) \
+            and not sources_changed([image_path], index["sources"]):
+        return index
+
+    image = Image.open(image_path).convert("RGBA")
+    width = min(width, image.width)
+    os.makedirs(tiles_dir, exist_ok=True)
+    tiles = []
+    for number, bottom in enumerate(range(image.height, 0, -tile_height)):
+        top = max(0, bottom - tile_height)
+        tile_name = f"tile_{number:03}.png"
+        image.crop((0, top, width, bottom)).save(
+            os.path.join(tiles_dir, tile_name))
+        tiles.append(tile_name)
+
+    index = {"version": TILES_VERSION,
+             "sources": fingerprint_sources([image_path]),
+             "width": width,
+             "height": image.height,
+             "tile_height": tile_height,
+             "tiles": tiles}
+    with open(os.path.join(tiles_dir, c.TILES_INDEX), "w") as index_file:
+        json.dump(index, index_file, indent=1)
+    return index
+
+
+class BackgroundTiles:
+    """
+    The loaded tiles of one sliced background image. Shared by every
+    TiledBackground drawn from that image (see tiles_for), so a level
+    drawing it mirrored reuses the tiles the previous level left loaded.
+    """
+    def __init__(self, image_path: str):
+        self.image_path = image_path
+        self.tiles_dir = tiles_dir_for(image_path)
+
+        index = slice_background(image_path)
+        self.tile_names = index["tiles"]
+        self.width = index["width"]
+        self.height = index["height"]
+        self.tile_height = index["tile_height"]
+
+        self.textures = {}  # loaded textures, by tile number
+        self.evicted = 0  # tiles removed from the atlas since it was rebuilt
+        self.decoding = {}  # futures of tile images being decoded, by number
+
+    def keep_only(self, wanted: range, needed: range = None) -> None:
+        """
+        Load wanted tiles that aren't loaded, and evict all others. Tiles
+        are decoded on worker threads: needed tiles (by default all wanted)
+        are waited for, the rest are only added once decoded
+        """
+        if needed is None:
+            needed = wanted
+        self.evict_unwanted(wanted)
+        self.decode_tiles(wanted)
+        self.finish_tiles(wanted, needed)
+
+    def evict_unwanted(self, wanted: range) -> None:
+        """Evict loaded tiles, and drop decodes, that aren't wanted"""
+        for number in list(self.textures):
+            if number not in wanted:
+                self.evict_tile(number)
+        for number in list(self.decoding):
+            if number not in wanted:
+                del self.decoding[number]  # scrolled away before it was used
+        if self.evicted >= c.BACKGROUND_REBUILD_EVICTIONS:
+            # Mid-scroll, so this frame hitches while the atlas is redrawn.
+            # Accepted: it happens once every BACKGROUND_REBUILD_EVICTIONS
+            # tiles scrolled past, and waiting for the level to unload
+            # would let a long level's tiles overflow the atlas
+            self.rebuild_atlas()
+
+    def decode_tiles(self, wanted: range) -> None:
+        """Start decoding wanted tiles that aren't loaded or decoding"""
+        for number in wanted:
+            if number not in self.textures and number not in self.decoding:
+                self.decoding[number] = executor().submit(
+                    decode_image, self.tile_path(number))
+
+    def finish_tiles(self, wanted: range, needed: range) -> None:
+        """Load decoded tiles, waiting for the decodes of needed ones"""
+        for number in wanted:
+            future = self.decoding.get(number)
+            if future and (number in needed or future.done()):
+                self.textures[number] = self.load_tile(number)
+
+    def tile_path(self, number: int) -> str:
+        return os.path.join(self.tiles_dir, self.tile_names[number])
+
+    def load_tile(self, number: int) -> arcade.Texture:
+        """Texture of a tile, from its decoded image (on the main thread)"""
+        image = self.decoding.pop(number).result()
+        return arcade.Texture(self.tile_path(number), image=image)
+
+    def evict_tile(self, number: int) -> None:
+        texture = self.textures.pop(number)
+        ctx = arcade.get_window().ctx
+        if ctx is None:  # headless, tile was never uploaded
+            return
+        atlas = ctx.default_atlas
+        if atlas.has_texture(texture):
+            atlas.remove(texture)
+            self.evicted += 1
+
+    def rebuild_atlas(self) -> None:
+        """
+        Reclaim the space of evicted tiles: the atlas only frees it when
+        rebuilt, so otherwise every tile scrolled in takes new space and
+        the atlas keeps growing. Batched, as a rebuild redraws every
+        texture in the atlas
+        """
+        if self.evicted:
+            arcade.get_window().ctx.default_atlas.rebuild()
+            self.evicted = 0
+
+    def unload(self) -> None:
+        self.decoding.clear()
+        for number in list(self.textures):
+            self.evict_tile(number)
+        self.rebuild_atlas()  # between levels, while the screen is black
+
+
+_tiles = {}  # BackgroundTiles by image path
+
+
+def tiles_for(image_path: str) -> BackgroundTiles:
+    if image_path not in _tiles:
+        _tiles[image_path] = BackgroundTiles(image_path)
+    return _tiles[image_path]
+
+
+class TiledBackground:
+    """
+    Tall scrolling background, drawn from tiles. Only the tiles near the
+    camera are loaded; tiles that scroll out of range are dropped.
+    If mirrored, the image is drawn upside down (by flipping each tile's
+    UVs, so no flipped copy of the image is needed).
+    """
+    def __init__(self, image_path: str, mirrored: bool = False,
+                 left: int = 0,
+                 bottom: int = c.SCREEN_HEIGHT - c.MAIN_VIEW_HEIGHT,
+                 lookahead: int = c.BACKGROUND_LOOKAHEAD_TILES):
+        self.tiles = tiles_for(image_path)
+        self.mirrored = mirrored
+        self.left = left
+        self.bottom = bottom
+        self.lookahead = lookahead  # tiles to load above the visible area
+
+        self.width = self.tiles.width
+        self.height = self.tiles.height
+
+    def tile_range(self, scroll_y: float, lookahead: int = None) -> range:
+        """Numbers of the tiles that should be loaded at this scroll"""
+        if lookahead is None:
+            lookahead = self.lookahead
+        tile_height = self.tiles.tile_height
+
+        # Rows of the map to keep loaded (one tile below the screen bottom,
+        # up to lookahead tiles above the top), counted from the map bottom
+        low = scroll_y - self.bottom - tile_height
+        high = scroll_y + c.SCREEN_HEIGHT - self.bottom \
+            + lookahead * tile_height
+        if self.mirrored:
+            low, high = self.height - high, self.height - low
+
+        first = max(0, int(low // tile_height))
+        last = min(len(self.tiles.tile_names) - 1, int(high // tile_height))
+        return range(first, last + 1)
+
+    def update(self, scroll_y: float) -> None:
+        """
+        Load tiles coming into range and evict those that left it (only
+        waiting for tiles on screen, the lookahead tiles load in the
+        background)
+        """
+        self.tiles.keep_only(self.tile_range(scroll_y),
+                             self.tile_range(scroll_y, lookahead=0))
+
+    def unload(self) -> None:
+        self.tiles.unload()
+
+    def draw(self) -> None:
+        tile_height = self.tiles.tile_height
+        for number, texture in self.tiles.textures.items():
+            if self.mirrored:
+                # Start from the tile's top edge with a negative height,
+                # which draws the same texture flipped vertically
+                top = self.bottom + self.height - number * tile_height
+                arcade.draw_lrwh_rectangle_textured(
+                    self.left, top, texture.width, -texture.height, texture)
+            else:
+                arcade.draw_lrwh_rectangle_textured(
+                    self.left, self.bottom + number * tile_height,
+                    texture.width, texture.height, texture)
+
+
+def build_background_tiles() -> None:
+    """Slice every streamed background ahead of time (if out of date)"""
+    for image_path in c.STREAMED_BACKGROUNDS:
+        slice_background(image_path)
+
+
+if __name__ == "__main__":
+    for path in c.STREAMED_BACKGROUNDS:
+        slice_background(path, force=True)
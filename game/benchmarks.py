@@ -0,0 +1,233 @@
+"""
+Frame time benchmarks: level setup time and per-frame on_update cost
+(plus on_draw with --draw, which needs a real window) for each scenario,
+with a fixed seed. Results are written to json and compared with a stored
+baseline; exits with an error if any scenario got slower than threshold.
+
+    python -m game.benchmarks                    # run, compare to baseline
+    python -m game.benchmarks --save-baseline    # run, store as baseline
+    python -m game.benchmarks --replay session.replay   # add a replay
+"""
+import argparse
+import arcade
+import game.constants as c
+from game.backgrounds import build_background_tiles
+from game.headless import new_view, script_events, send_keys
+from game.replay import Recording
+import json
+import os
+import statistics
+import sys
+import time
+
+
+RESULTS_JSON = "benchmark_results.json"
+BASELINE_JSON = "benchmark_baseline.json"
+SETUP_RUNS = 5  # setups timed per scenario, as one is too noisy to compare
+
+WALK = [(0, "press", arcade.key.D), (60, "release", arcade.key.D),
+        (60, "press", arcade.key.W), (120, "release", arcade.key.W)]
+
+# name: level, frames to time, spawn counts changed for the scenario (see
+# levels.json), constants changed for the scenario, script
+SCENARIOS = {
+    "home": ("home", 600, {}, {}, WALK),
+    "foreign_hive": ("foreign_hive", 600, {}, {}, WALK),
+    "foreign_hive_crowded": ("foreign_hive", 600,
+                             {"bees": 3000, "honey": 300}, {}, WALK),
+    "foreign_hive_sparse": ("foreign_hive", 600,
+                            {"bees": 100, "honey": 5}, {}, WALK),
+    "outside_leave": ("outside_leave", 300, {}, {}, ()),
+    "outside_return": ("outside_return", 600, {}, {}, ()),
+    "outside_return_long": ("outside_return", 3600, {}, {}, ()),
+    "outside_return_swarm": ("outside_return", 1800, {"wasps": 60},
+                             {"WASP_ATTACK_INTERVAL": .2}, ()),
+}
+
+
+def percentiles(times: list) -> dict:
+    """p50/p95/p99 (nearest rank) and mean of times, in milliseconds"""
+    ordered = sorted(times)
+    if not ordered:
+        return {}
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    return {"p50": rank(50) * 1000, "p95": rank(95) * 1000,
+            "p99": rank(99) * 1000,
+            "mean": sum(ordered) / len(ordered) * 1000}
+
+
+def new_benchmark_view(seed: int, draw_window=None) -> arcade.View:
+    """Game view in draw_window, or (if None) a headless one"""
+    if not draw_window:
+        return new_view(seed)
+    from game.views.game_view import GameView
+    draw_window.rng.reseed(seed)
+    view = GameView()
+    draw_window.change_view(view)
+    return view
+
+
+def time_setup(make_view, level: str) -> tuple:
+    """
+    Median time to set level up, over SETUP_RUNS new views from make_view
+    (caches are warm after the first). Returns it and the last view
+    """
+    setup_times = []
+    for _ in range(SETUP_RUNS):
+        view = make_view()
+        start = time.perf_counter()
+        view.setup(level)
+        setup_times.append(time.perf_counter() - start)
+    return statistics.median(setup_times), view
+
+
+def time_frames(view: arcade.View, frames: int, events: dict,
+                draw_window=None, level: str = None) -> dict:
+    """
+    Times frames updates (and draws, if draw_window) of view, stopping
+    early if level is given and the game leaves it
+    """
+    update_times, draw_times = [], []
+    for frame in range(frames):
+        send_keys(view, events.get(frame, ()))
+        start = time.perf_counter()
+        view.section_manager.on_update(c.FIXED_TIMESTEP)
+        update_times.append(time.perf_counter() - start)
+        if level and view.get_level_name() != level:  # stop timing
+            break
+        if draw_window:
+            start = time.perf_counter()
+            view.section_manager.on_draw()
+            draw_window.ctx.finish()  # wait for the GPU too
+            draw_times.append(time.perf_counter() - start)
+
+    result = {"frames": len(update_times),
+              "update_ms": percentiles(update_times)}
+    if draw_times:
+        result["draw_ms"] = percentiles(draw_times)
+    return result
+
+
+def run_scenario(level: str, frames: int, spawns: dict, constants: dict,
+                 script, seed: int, draw_window=None) -> dict:
+    """Times one scenario (with constants patched for its duration)"""
+    original = {name: getattr(c, name) for name in constants}
+    for name, value in constants.items():
+        setattr(c, name, value)
+
+    def make_view():
+        view = new_benchmark_view(seed, draw_window)
+        view.registry.set_spawns(level, spawns)
+        return view
+
+    try:
+        setup_time, view = time_setup(make_view, level)
+        result = time_frames(view, frames, script_events(script),
+                             draw_window, level)
+    finally:
+        for name, value in original.items():
+            setattr(c, name, value)
+    return {"setup_ms": setup_time * 1000, **result}
+
+
+def run_replay(path: str, draw_window=None) -> dict:
+    """Times a recorded session (see Recording), played back exactly"""
+    recording = Recording.load(path)
+
+    def make_view():
+        view = new_benchmark_view(recording.seed, draw_window)
+        view.play(recording)
+        return view
+
+    setup_time, view = time_setup(make_view, recording.start_level)
+    result = time_frames(view, recording.length(), {}, draw_window)
+    return {"setup_ms": setup_time * 1000, **result}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns a description of each timing more than threshold (e.g. .2 for
+    20%) slower than in the baseline
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        timings = [("setup_ms", result["setup_ms"], old["setup_ms"])]
+        for kind in ["update_ms", "draw_ms"]:
+            for stat in ["p50", "p95", "p99"]:
+                if stat in result.get(kind, {}) and \
+                        stat in old.get(kind, {}):
+                    timings.append((f"{kind} {stat}", result[kind][stat],
+                                    old[kind][stat]))
+        for (timing, new_ms, old_ms) in timings:
+            if new_ms > old_ms * (1 + threshold):
+                regressions.append(f"{name} {timing}: {old_ms:.3f}ms -> "
+                                   f"{new_ms:.3f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS),
+                        help="scenarios to run (default all)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=RESULTS_JSON)
+    parser.add_argument("--baseline", default=BASELINE_JSON)
+    parser.add_argument("--threshold", type=float, default=.2,
+                        help="slowdown allowed before failing (.2 = 20%%)")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--draw", action="store_true",
+                        help="also time on_draw (opens a window)")
+    parser.add_argument("--replay", action="append", default=[],
+                        metavar="FILE",
+                        help="also time a session saved with --record")
+    args = parser.parse_args()
+
+    draw_window = None
+    if args.draw:
+        from game.__main__ import Window
+        from game.sprites import Player
+        draw_window = Window(c.SCREEN_WIDTH, c.SCREEN_HEIGHT, c.GAME_TITLE)
+        draw_window.player = Player()  # normally made behind the splash
+    build_background_tiles()
+
+    results = {}
+    for name in args.scenarios:
+        results[name] = run_scenario(*SCENARIOS[name], seed=args.seed,
+                                     draw_window=draw_window)
+    for path in args.replay:
+        results[f"replay:{path}"] = run_replay(path, draw_window)
+
+    for name in results:
+        update = results[name]["update_ms"]
+        print(f"{name}: setup {results[name]['setup_ms']:.1f}ms, update "
+              f"p50 {update['p50']:.3f}ms p95 {update['p95']:.3f}ms "
+              f"p99 {update['p99']:.3f}ms")
+
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=1)
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=1)
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline} (make one with "
+              f"--save-baseline)")
+        return
+    with open(args.baseline) as baseline_file:
+        regressions = compare(results, json.load(baseline_file),
+                              args.threshold)
+    for regression in regressions:
+        print("REGRESSION", regression)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,48 @@ DEBUG = True
 
 # Window Settings:
 BACKGROUND_COLOR = arcade.color.BLACK
-FADE_RATE = 5  # TODO: do fading of views
+FADE_RATE = 17  # alpha change per step when fading between levels
+FIXED_TIMESTEP = 1 / 60  # seconds of game time per step of level logic
+MAX_SUBSTEPS = 5  # most steps per frame, if further behind the game slows
+MAX_FPS = 60  # frames drawn per second, at most
 GAME_TITLE = "Honey Thief"
+SPLASH_TARGET = .5  # seconds from start to showing the splash screen
+SPLASH_FRAME_BUDGET = 1 / 30  # seconds of loading per splash screen frame
+
+# Control Settings
+MOVE_KEYS = {arcade.key.W: "up", arcade.key.UP: "up",
+             arcade.key.S: "down", arcade.key.DOWN: "down",
+             arcade.key.A: "left", arcade.key.LEFT: "left",
+             arcade.key.D: "right", arcade.key.RIGHT: "right"}
+
+# Performance Overlay Settings (DEBUG only)
+PERF_OVERLAY_KEY = arcade.key.F3  # show/hide overlay (and start timing)
+PERF_DUMP_KEY = arcade.key.F4  # write last PERF_DUMP_SECONDS to a file
+PERF_DUMP_SECONDS = 5.
+PERF_DUMP_FILE = "perf_dump.json"
+PERF_HISTORY_FRAMES = 600  # frames of timings kept
+PERF_OVERLAY_REFRESH = .5  # seconds between overlay text updates
+PERF_HISTOGRAM_BOUNDS = [1 / 120, 1 / 60, 1 / 30, 1 / 15]  # frame times
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 750
 
+# Asset Settings
+SPRITES_DIR = "assets/sprites"
+ATLAS_DIR = "assets/atlas"  # built from SPRITES_DIR (see game/atlas.py)
+ATLAS_INDEX = "sprites.json"
+ATLAS_PAGE_SIZE = 512
+TILES_DIR = "assets/tiles"  # streamed background tiles (backgrounds.py)
+TILES_INDEX = "tiles.json"
+
+# Sound Settings
+SOUNDS = {
+    "hurt": "assets/sounds/hurt.wav",
+    "honey": "assets/sounds/honey.wav",
+    "jump": "assets/sounds/jump.wav"
+}
+BACKGROUND_MUSIC = "assets/sounds/background.wav"
+
 # Main Game View Settings
 BACKGROUND_IMAGE = "assets/backgrounds/honeycomb.png"
 CAMERA_SPEED = 2.0
@@ -19,10 +55,18 @@ EXIT_HOLE_PINK = "assets/sprites/exit_hole_pink.png"
 HOME_BACKGROUND = "assets/backgrounds/honeycomb_map_pink_empty.png"
 MAIN_VIEW_WIDTH = SCREEN_WIDTH
 MAIN_VIEW_HEIGHT = 600
-OUTSIDE_HEIGHT = 8896
 OUTSIDE_IMAGE = "assets/backgrounds/wilderness_neighborhood.png"
-OUTSIDE_FLIPPED = "assets/backgrounds/wilderness_neighborhood_flipped.png"
+STREAMED_BACKGROUNDS = [OUTSIDE_IMAGE]  # see backgrounds.py
+BACKGROUND_TILE_HEIGHT = 512
+BACKGROUND_LOOKAHEAD_TILES = 2  # tiles loaded above the top of the screen
+BACKGROUND_REBUILD_EVICTIONS = 6  # tiles evicted before reclaiming atlas
 PADDING = 25  # how many pixels from edge of screen to place sprites
+PLACEMENT_ATTEMPTS = 200  # random spots tried per sprite before giving up
+PLACEMENT_CELL_SIZE = 32
+RANDOM_SEED = None  # set to an int to replay the same layouts/attacks
+
+SETUP_BATCH_SIZE = 50  # sprites created per frame when preparing a level
+TEXTURE_BATCH_SIZE = 4  # decoded images made into textures per frame
 
 # Foreign Hive Settings
 TIME_LIMIT = 30
@@ -31,14 +75,14 @@ TIME_LIMIT = 30
 INFO_BAR_HEIGHT = 150
 INFO_BAR_WIDTH = SCREEN_WIDTH
 TYPING_SPEED = 4
+MESSAGES_POLL_INTERVAL = 1.  # seconds between checks for edited messages
 
 # Sprite Settings:
 ANIMATION_SPEED = 3  # lower = slow, higher = faster
-BEE_ENEMY_COUNT = 600
 BEE_ENEMY_SCALING = 1.5
 BEE_ENEMY_IMAGE = "assets/sprites/bee.png"
-BEE_FRIEND_COUNT = 20
 BEE_FRIEND_SCALING = 1.0
+BEE_FRIEND_ROTATE_CHANCE = 30  # home bees, higher means less likely to turn
 BEE_ROTATE_CHANCE = 2000  # higher means bees less likely to change angle
 BEE_FRIEND_IMAGE = "assets/sprites/bee_player_move1_2.png"
 BEE_ENEMY_MOVING_1 = "assets/sprites/foreign_bees_moving1.png"
@@ -46,7 +90,6 @@ BEE_ENEMY_MOVING_2 = "assets/sprites/foreign_bees_moving2.png"
 BEE_ENEMY_MOVING_3 = "assets/sprites/foreign_bees_moving3.png"
 
 HONEY_SPRITE_SCALING = 1.25
-HONEY_SPRITE_COUNT = 15
 HONEY_SPRITE_IMAGE = "assets/sprites/honey.png"
 
 PLAYER_SPRITE_SCALING = 1.0
@@ -54,6 +97,15 @@ PLAYER_SPRITE_IMAGE = "assets/sprites/bee_player_move1_2.png"
 PLAYER_MOVE_1 = "assets/sprites/bee_player_move1.png"
 PLAYER_MOVE_2 = "assets/sprites/bee_player_move2.png"
 PLAYER_MOVE_3 = "assets/sprites/bee_player_move3.png"
+PLAYER_SHADOW_IMAGE = "assets/sprites/bee_shadow1.png"
+PLAYER_WALKING_IMAGES = ["assets/sprites/bee_player_move1.png",
+                         "assets/sprites/bee_player_move2.png"]
+PLAYER_FLYING_IMAGES = ["assets/sprites/bee_shadow1.png",
+                        "assets/sprites/bee_shadow2.png"]
+PLAYER_HURT_IMAGES = ["assets/sprites/player_hurt1.png",
+                      "assets/sprites/player_hurt2.png"]
+PLAYER_OUTSIDE_IMAGES = ["assets/sprites/player_outside1.png",
+                         "assets/sprites/player_outside2.png"]
 PLAYER_MOVE_SPEED = 1.75
 PLAYER_ANGLE_SPEED = 3.
 
@@ -66,7 +118,10 @@ SCENT_DELTA_X_MAX = 300
 
 WASP_SCALING = 1.5
 WASP_IMAGE = "assets/sprites/wasp_flying1.png"
-WASP_SPEED_MIN = 7.
-WASP_SPEED_MAX = 8.
+WASP_FLYING_IMAGES = ["assets/sprites/wasp_flying1.png",
+                      "assets/sprites/wasp_flying2.png"]
+WASP_SPEED_MIN = 7
+WASP_SPEED_MAX = 8
 WASP_ATTACK_INTERVAL = 3
 WASP_SPACING = 150
+WASP_CULL_MARGIN = 800  # wasps this far out of view are returned to pool
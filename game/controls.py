@@ -0,0 +1,78 @@
+from collections import deque
+import time
+
+
+# Directions held, as bits of InputController.pressed
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+DIRECTIONS = {"up": UP, "down": DOWN, "left": LEFT, "right": RIGHT}
+
+# Movement (x, y) and facing angle for each pressed mask. The player only
+# moves while exactly one direction is held
+MOVES = {UP: ((0, 1), 0), DOWN: ((0, -1), 180),
+         LEFT: ((-1, 0), 90), RIGHT: ((1, 0), 270)}
+
+
+class InputController:
+    """
+    Which directions the player is holding, shared by every level (so it
+    carries over level changes). Keys are mapped to directions through a
+    table; subscribers are called (with the controller) each time the
+    direction held changes, rather than checking the keys every step.
+    Also measures input latency: time from a change to the next step that
+    moves the player (see moved).
+    """
+    def __init__(self, keys: dict, history: int = 120):
+        # key: bit of its direction (keys maps key to direction name)
+        self.key_bits = {key: DIRECTIONS[name] for key, name in keys.items()}
+        self.pressed = 0  # bitmask of directions held
+        self.direction = (0, 0)  # movement (x, y), each -1, 0 or 1
+        self.angle = None  # facing of direction (None if not moving)
+        self.subscribers = []
+        self.changed_at = None  # time of a change not yet moved on
+        self.latencies = deque(maxlen=history)  # seconds, newest last
+
+    @property
+    def walking(self) -> bool:
+        return self.pressed != 0
+
+    def subscribe(self, callback) -> None:
+        """Call callback(controller) on every change"""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def press(self, key: int) -> bool:
+        """Returns whether key is a direction key"""
+        bit = self.key_bits.get(key, 0)
+        if bit and not self.pressed & bit:  # ignore key repeats
+            self.set_pressed(self.pressed | bit)
+        return bool(bit)
+
+    def release(self, key: int) -> bool:
+        bit = self.key_bits.get(key, 0)
+        if self.pressed & bit:
+            self.set_pressed(self.pressed & ~bit)
+        return bool(bit)
+
+    def clear(self) -> None:
+        self.set_pressed(0)
+
+    def set_pressed(self, pressed: int) -> None:
+        self.pressed = pressed
+        self.direction, self.angle = MOVES.get(pressed, ((0, 0), None))
+        self.changed_at = time.perf_counter()
+        for callback in list(self.subscribers):
+            callback(self)
+
+    def moved(self) -> None:
+        """Called after each step: the player has moved on the last change"""
+        if self.changed_at is not None:
+            self.latencies.append(time.perf_counter() - self.changed_at)
+            self.changed_at = None
+
+    def average_latency(self) -> float:
+        if not self.latencies:
+            return 0.
+        return sum(self.latencies) / len(self.latencies)
@@ -0,0 +1,74 @@
+import math
+import random
+from game.rng import randranges
+
+
+class BeeCrowd:
+    """
+    Idle animation for a whole crowd of bees, run as one batch per frame
+    (instead of an update_animation() call per bee).
+
+    Each frame every bee has a 1 in (rotate_chance + 1) chance to turn.
+    Rather than rolling for each bee, the gap to the next bee that turns is
+    drawn directly, so a frame costs one draw plus one per bee that turns.
+    Bees passed to flutter() show flutter_texture for that frame; only
+    bees whose texture actually changes are written to.
+    """
+    def __init__(self, bees: list, rotate_chance: int,
+                 turn: tuple = (-45, 45), relative: bool = True,
+                 idle_texture=None, flutter_texture=None,
+                 rng: random.Random = None):
+        self.bees = list(bees)
+        self.turn = turn  # range of (new or change of) angle when turning
+        self.relative = relative  # whether angle is changed by or set to
+        self.idle_texture = idle_texture
+        self.flutter_texture = flutter_texture
+        self.random = rng or random.Random()
+
+        # log of chance a bee doesn't turn, for drawing gaps between turns
+        self.log_stay = math.log(1 - 1 / (rotate_chance + 1))
+
+        self.fluttering = set()  # bees to flutter this frame
+        self.fluttered = set()  # bees showing flutter_texture
+
+    def flutter(self, bees) -> None:
+        """Flutter bees' wings (for the next update)"""
+        self.fluttering.update(bees)
+
+    def skip(self) -> int:
+        """Number of bees that don't turn before the next one that does"""
+        return int(math.log(1. - self.random.random()) / self.log_stay)
+
+    def update(self) -> None:
+        if self.flutter_texture:
+            for bee in self.fluttered - self.fluttering:
+                bee.texture = self.idle_texture
+            for bee in self.fluttering - self.fluttered:
+                bee.texture = self.flutter_texture
+        stopped = self.fluttered
+        self.fluttered = self.fluttering
+        self.fluttering = stopped
+        self.fluttering.clear()
+
+        # Fluttering bees are busy, they don't turn
+        turning = []
+        index = self.skip()
+        while index < len(self.bees):
+            bee = self.bees[index]
+            if bee not in self.fluttered:
+                turning.append(bee)
+            index += 1 + self.skip()
+
+        angles = randranges(self.random, len(turning), *self.turn)
+        for bee, angle in zip(turning, angles):
+            if self.relative:
+                angle = (bee.angle + angle) % 360
+            bee.angle = angle
+
+    def reset(self) -> None:
+        """Stop all fluttering"""
+        if self.flutter_texture:
+            for bee in self.fluttered:
+                bee.texture = self.idle_texture
+        self.fluttered.clear()
+        self.fluttering.clear()
@@ -0,0 +1,139 @@
+"""
+Runs the game's levels without a window or OpenGL context: on_update only,
+at a fixed timestep, with scripted key presses. For soak testing and
+profiling the update logic (e.g. in CI), far faster than real time.
+
+    python -m game.headless --frames 20000 --seed 1
+    python -m game.headless --replay session.replay
+"""
+import argparse
+import arcade
+import game.constants as c
+from game.rng import RandomStreams
+from game.replay import Recording
+from game.sprites import Player
+from game.views.game_view import GameView
+import time
+
+
+class HeadlessWindow:
+    """
+    Stand-in for the game window (game/__main__.py), with what the views
+    and sections use of it, but nothing to draw on
+    """
+    def __init__(self, width: int = c.SCREEN_WIDTH,
+                 height: int = c.SCREEN_HEIGHT, seed: int = None):
+        self.width = width
+        self.height = height
+        self.ctx = None  # no OpenGL context, nothing is ever drawn
+        self.background_color = c.BACKGROUND_COLOR
+        self.current_view = None
+        self.views = {}
+        self.rng = RandomStreams(seed)
+        self.player = Player()
+
+    def show_view(self, view: arcade.View) -> None:
+        self.current_view = view
+
+    def change_view(self, view: arcade.View) -> None:
+        self.views[view.name] = view
+        self.show_view(view)
+
+    def clear(self, *args, **kwargs) -> None:
+        pass
+
+    def push_handlers(self, *args, **kwargs) -> None:
+        pass
+
+    def remove_handlers(self, *args, **kwargs) -> None:
+        pass
+
+
+class HeadlessView(GameView):
+    """Game view without the info bar (it only draws)"""
+    show_info_bar = False
+
+
+def new_view(seed: int = None) -> HeadlessView:
+    """Headless window (made the current arcade window) and a view in it"""
+    window = HeadlessWindow(seed=seed)
+    arcade.set_window(window)
+    view = HeadlessView()
+    window.change_view(view)
+    return view
+
+
+def script_events(script) -> dict:
+    """(frame, "press" or "release", key) events, by frame"""
+    events = {}
+    for (frame, action, key) in script:
+        events.setdefault(frame, []).append((action, key))
+    return events
+
+
+def send_keys(view: arcade.View, events) -> None:
+    for (action, key) in events:
+        if action == "press":
+            view.section_manager.on_key_press(key, 0)
+        else:
+            view.section_manager.on_key_release(key, 0)
+
+
+def run(frames: int, script=(), level: str = "home", seed: int = None,
+        delta_time: float = 1 / 60) -> list:
+    """
+    Simulates frames updates of delta_time each, starting in level.
+    script is (frame, "press" or "release", key) events, sent before that
+    frame's update. Returns the (step, level name) of each level entered
+    """
+    view = new_view(seed)
+    view.setup(level)
+    events = script_events(script)
+
+    for frame in range(frames):
+        send_keys(view, events.get(frame, ()))
+        view.section_manager.on_update(delta_time)
+    return view.level_log
+
+
+def replay(recording: Recording) -> list:
+    """
+    Plays recording back (a step per frame), returning the (step, level
+    name) of each level entered, to compare with recording.levels
+    """
+    view = new_view(recording.seed)
+    view.play(recording)
+    view.setup(recording.start_level)
+    for _ in range(recording.length()):
+        view.section_manager.on_update(c.FIXED_TIMESTEP)
+    return view.level_log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--level", default="home")
+    parser.add_argument("--seed", type=int, default=c.RANDOM_SEED)
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play back a session saved with --record")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.replay:
+        recording = Recording.load(args.replay)
+        levels = replay(recording)
+        frames = recording.length()
+        if levels != recording.levels:
+            print("Replay went differently from the recorded session!")
+    else:
+        levels = run(args.frames, level=args.level, seed=args.seed)
+        frames = args.frames
+    seconds = time.perf_counter() - start
+    for (frame, name) in levels:
+        print(f"frame {frame}: {name}")
+    print(f"{frames} frames in {seconds:.2f}s "
+          f"({frames / seconds:.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+def lerp(start, end, alpha: float):
+    """
+    Value alpha of the way from start to end (numbers, or tuples/lists of
+    them: arcade keeps a sprite's position as whichever it was set to)
+    """
+    if isinstance(start, (tuple, list)):
+        return tuple(lerp(a, b, alpha) for a, b in zip(start, end))
+    return start + (end - start) * alpha
+
+
+class Interpolator:
+    """
+    Draws moving things between where the last fixed step left them and
+    where they were before it (so motion looks smooth whatever the frame
+    rate). save() the attributes before a step, apply() before drawing,
+    and restore() the stepped values before stepping again.
+    """
+    def __init__(self):
+        self.previous = []  # (object, attribute, value before last step)
+        self.actual = []  # (object, attribute, stepped value) while applied
+
+    def save(self, attributes: list) -> None:
+        """attributes are (object, attribute name) pairs"""
+        self.previous = [(obj, name, getattr(obj, name))
+                         for (obj, name) in attributes]
+
+    def apply(self, alpha: float) -> None:
+        self.actual = []
+        for (obj, name, before) in self.previous:
+            stepped = getattr(obj, name)
+            self.actual.append((obj, name, stepped))
+            setattr(obj, name, lerp(before, stepped, alpha))
+
+    def restore(self) -> None:
+        for (obj, name, stepped) in self.actual:
+            setattr(obj, name, stepped)
+        self.actual = []
+
+    def clear(self) -> None:
+        """Forget the previous values (e.g. after sprites jump elsewhere)"""
+        self.restore()
+        self.previous = []
@@ -0,0 +1,51 @@
+import importlib
+import json
+
+
+LEVELS_JSON = "game/levels.json"
+
+
+class LevelRegistry:
+    """
+    The game's levels, as described in a json file: for each level name,
+    its section class, the textures and sounds it uses, how many of each
+    sprite it spawns, its sprite lists and the levels it leads to.
+    Section classes are only imported when a level is first made.
+    """
+    def __init__(self, path: str = LEVELS_JSON):
+        with open(path) as levels_file:
+            self.entries = json.load(levels_file)
+        self.classes = {}  # section classes imported so far, by level name
+
+    def names(self) -> list:
+        return list(self.entries)
+
+    def section_class(self, name: str) -> type:
+        if name not in self.classes:
+            module_name, class_name = \
+                self.entries[name]["section"].rsplit(".", 1)
+            module = importlib.import_module(module_name)
+            self.classes[name] = getattr(module, class_name)
+        return self.classes[name]
+
+    def new_level(self, name: str):
+        """Makes the level's section (not set up yet, see setup_steps)"""
+        entry = self.entries[name]
+        level = self.section_class(name)()
+        level.name = name
+        level.transitions = dict(entry["transitions"])
+        level.previous_level = level.transitions.get("previous")
+        level.next_level = level.transitions.get("next")
+        level.spawns = dict(entry.get("spawns", {}))
+        level.sprite_list_specs = entry.get("sprite_lists", [])
+        return level
+
+    def textures(self, name: str) -> list:
+        return self.entries[name].get("textures", [])
+
+    def sounds(self, name: str) -> list:
+        return self.entries[name].get("sounds", [])
+
+    def set_spawns(self, name: str, spawns: dict) -> None:
+        """Change how many of each sprite a level spawns (before it's made)"""
+        self.entries[name].setdefault("spawns", {}).update(spawns)
@@ -0,0 +1,69 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+
+
+# Worker threads shared by every loader, started on first use
+_executor = None
+
+
+def executor(workers: int = None) -> ThreadPoolExecutor:
+    """The shared pool of worker threads (a thread per core by default)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count(),
+                                       thread_name_prefix="asset_loader")
+    return _executor
+
+
+class AssetLoader:
+    """
+    Loads assets in two parts: decode(key) runs on a worker thread (file
+    reading and decoding, e.g. Pillow, release the GIL so files decode in
+    parallel), then finish(key, decoded) makes the asset on the main thread
+    (anything touching arcade/OpenGL), a batch at a time.
+    """
+    def __init__(self, decode, finish):
+        self.decode = decode
+        self.finish = finish
+        self.decoding = {}  # key: future of decoded data, not yet finished
+        self.assets = {}  # key: finished asset
+
+    def request(self, key) -> Future:
+        """
+        Start decoding key (if not already loaded or decoding). Returns a
+        future that is done once it's decoded (see get to finish it)
+        """
+        if key in self.assets:
+            future = Future()
+            future.set_result(None)
+            return future
+        if key not in self.decoding:
+            self.decoding[key] = executor().submit(self.decode, key)
+        return self.decoding[key]
+
+    def request_all(self, keys) -> list:
+        return [self.request(key) for key in keys]
+
+    def get(self, key):
+        """Returns the asset, waiting for just this key if it's not done"""
+        asset = self.assets.get(key)
+        if asset is None:
+            future = self.decoding.pop(key, None)
+            decoded = future.result() if future else self.decode(key)
+            asset = self.assets[key] = self.finish(key, decoded)
+        return asset
+
+    def finish_ready(self, limit: int = None) -> int:
+        """Finish up to limit decoded assets (all if None), returns count"""
+        ready = [key for key, future in self.decoding.items()
+                 if future.done()][:limit]
+        for key in ready:
+            self.get(key)
+        return len(ready)
+
+    def loaded(self, keys) -> bool:
+        return all(key in self.assets for key in keys)
+
+    def clear(self) -> None:
+        self.decoding.clear()
+        self.assets.clear()
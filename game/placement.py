@@ -0,0 +1,69 @@
+import math
+import random
+
+
+class PlacementError(Exception):
+    """Raised when no free spot is found within the attempt budget"""
+    pass
+
+
+class SpritePlacer:
+    """
+    Picks random, non-overlapping positions for sprites in a rectangle.
+    Sprites are treated as circles; placed circles are stored in a uniform
+    grid so each attempt only checks the circles in nearby cells.
+    """
+    def __init__(self, left: float, bottom: float, right: float, top: float,
+                 cell_size: float = 32., attempts: int = 100,
+                 seed=None, rng: random.Random = None):
+        self.left = left
+        self.bottom = bottom
+        self.right = right
+        self.top = top
+        self.cell_size = cell_size
+        self.attempts = attempts  # random spots tried before giving up
+        self.random = rng or random.Random(seed)
+
+        self.cells = {}  # (column, row) -> list of (x, y, radius)
+        self.max_radius = 0.
+        self.count = 0
+
+    def cell_of(self, x: float, y: float) -> tuple:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def add_obstacle(self, x: float, y: float, radius: float) -> None:
+        """Register a circle that later positions must not overlap"""
+        self.cells.setdefault(self.cell_of(x, y), []).append((x, y, radius))
+        self.max_radius = max(self.max_radius, radius)
+        self.count += 1
+
+    def is_free(self, x: float, y: float, radius: float) -> bool:
+        """Whether a circle at (x, y) would overlap no registered circle"""
+        reach = math.ceil((radius + self.max_radius) / self.cell_size)
+        column, row = self.cell_of(x, y)
+        for i in range(column - reach, column + reach + 1):
+            for j in range(row - reach, row + reach + 1):
+                for (other_x, other_y, other_radius) in \
+                        self.cells.get((i, j), ()):
+                    distance = radius + other_radius
+                    if (x - other_x) ** 2 + (y - other_y) ** 2 < \
+                            distance * distance:
+                        return False
+        return True
+
+    def random_position(self, radius: float, obstacle: bool = True) -> tuple:
+        """
+        Returns a random free (x, y) for a circle of radius.
+        If obstacle, the circle is registered so later ones avoid it.
+        Raises PlacementError if all attempts overlap something.
+        """
+        for _ in range(self.attempts):
+            x = self.random.uniform(self.left, self.right)
+            y = self.random.uniform(self.bottom, self.top)
+            if self.is_free(x, y, radius):
+                if obstacle:
+                    self.add_obstacle(x, y, radius)
+                return (x, y)
+        raise PlacementError(
+            f"no free spot for radius {radius} after {self.attempts} "
+            f"attempts ({self.count} sprites already placed)")
@@ -0,0 +1,21 @@
+class SpritePool:
+    """
+    Fixed number of sprites, made up front and handed out for reuse
+    (so sprites that come and go don't have to be created every time)
+    """
+    def __init__(self, factory, capacity: int):
+        self.capacity = capacity
+        self.free = [factory() for _ in range(capacity)]
+
+    def acquire(self):
+        """Returns a free sprite, or None if they're all in use"""
+        if self.free:
+            return self.free.pop()
+        return None
+
+    def release(self, sprite) -> None:
+        """Take back a sprite (after removing it from its sprite lists)"""
+        self.free.append(sprite)
+
+    def in_use(self) -> int:
+        return self.capacity - len(self.free)
@@ -0,0 +1,147 @@
+from collections import deque
+from contextlib import contextmanager
+import json
+import time
+
+
+class FrameProfiler:
+    """
+    Time spent per frame in each phase of the game (collisions, sprite
+    updates, drawing...), for the last frames. Phases are timed by wrapping
+    watched methods, and only while enabled: when disabled the wrappers are
+    removed, so the methods run exactly as they would without a profiler.
+    """
+    def __init__(self, history: int = 600):
+        self.enabled = False
+        self.frames = deque(maxlen=history)  # (frame time, {phase: time})
+        self.phases = {}  # phase times of the frame so far
+        self.watched = []  # (object, method name, phase)
+        self.originals = []  # (object, method name, own attribute or None)
+
+    def watch(self, obj, method_name: str, phase: str) -> None:
+        """Time calls of obj's method as phase (while enabled)"""
+        self.watched.append((obj, method_name, phase))
+        if self.enabled:
+            self.wrap(obj, method_name, phase)
+
+    def unwatch_all(self) -> None:
+        self.unwrap_all()
+        self.watched.clear()
+
+    def wrap(self, obj, method_name: str, phase: str) -> None:
+        method = getattr(obj, method_name)
+        self.originals.append((obj, method_name,
+                               vars(obj).get(method_name)))
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.phases[phase] = self.phases.get(phase, 0.) + \
+                    time.perf_counter() - start
+
+        setattr(obj, method_name, timed)
+
+    def unwrap_all(self) -> None:
+        """Put back the methods replaced by wrap(), newest first"""
+        for (obj, method_name, original) in reversed(self.originals):
+            if original is None:
+                delattr(obj, method_name)  # back to the class's method
+            else:
+                setattr(obj, method_name, original)
+        self.originals.clear()
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        if self.enabled:
+            for (obj, method_name, phase) in self.watched:
+                self.wrap(obj, method_name, phase)
+        else:
+            self.unwrap_all()
+        self.phases = {}
+
+    def end_frame(self, frame_time: float) -> None:
+        """Store the phase times of the frame that took frame_time"""
+        if self.enabled:
+            self.frames.append((frame_time, self.phases))
+            self.phases = {}
+
+    def fps(self) -> float:
+        total = sum(frame_time for frame_time, _ in self.frames)
+        return len(self.frames) / total if total else 0.
+
+    def phase_averages(self) -> dict:
+        """Average time per frame spent in each phase"""
+        totals = {}
+        for _, phases in self.frames:
+            for phase, phase_time in phases.items():
+                totals[phase] = totals.get(phase, 0.) + phase_time
+        return {phase: total / len(self.frames)
+                for phase, total in totals.items()}
+
+    def histogram(self, bounds: list) -> list:
+        """
+        Count of frames with frame time below each bound (that weren't
+        below the bound before it), plus a count for frames above them all
+        """
+        counts = [0] * (len(bounds) + 1)
+        for frame_time, _ in self.frames:
+            bucket = 0
+            while bucket < len(bounds) and frame_time >= bounds[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        return counts
+
+    def last_seconds(self, seconds: float) -> list:
+        """The stored frames covering (about) the last seconds"""
+        frames = []
+        total = 0.
+        for frame in reversed(self.frames):
+            if total >= seconds:
+                break
+            frames.append(frame)
+            total += frame[0]
+        frames.reverse()
+        return frames
+
+    def dump(self, path: str, seconds: float) -> None:
+        """Write the last seconds of frames to a json file"""
+        frames = [{"frame_time": frame_time, "phases": phases}
+                  for frame_time, phases in self.last_seconds(seconds)]
+        with open(path, "w") as dump_file:
+            json.dump({"fps": self.fps(), "frames": frames}, dump_file,
+                      indent=1)
+
+
+class StartupProfile:
+    """
+    Time spent in each phase of starting the game (imports, window, assets,
+    level setup...), and how long after start named points were reached
+    """
+    def __init__(self, start: float = None):
+        self.start = time.perf_counter() if start is None else start
+        self.phases = {}  # total seconds spent in each phase
+        self.marks = {}  # seconds after start each point was first reached
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.) + seconds
+
+    def mark(self, name: str) -> None:
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+
+    def report(self) -> str:
+        lines = [f"{name}: {seconds * 1000:.1f}ms"
+                 for name, seconds in self.phases.items()]
+        lines += [f"{name} after {seconds * 1000:.1f}ms"
+                  for name, seconds in self.marks.items()]
+        return "\n".join(lines)
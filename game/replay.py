@@ -0,0 +1,57 @@
+import gzip
+import json
+
+
+REPLAY_VERSION = 1  # bump if the file format changes
+
+PRESS, RELEASE = 1, 0
+
+
+class Recording:
+    """
+    Everything needed to play a session again exactly as it went: the
+    random seed, the first level and every key event, by the number of
+    fixed steps (see GameView.on_update) run before it. Also keeps the
+    levels entered, to check a replay took the same path.
+    """
+    def __init__(self, seed: int, start_level: str = "home",
+                 events: list = None, levels: list = None):
+        self.seed = seed
+        self.start_level = start_level
+        self.events = events or []  # (step, PRESS or RELEASE, key)
+        self.levels = levels or []  # (step, level name) of levels entered
+
+    def add_event(self, step: int, action: int, key: int) -> None:
+        self.events.append((step, action, key))
+
+    def events_by_step(self) -> dict:
+        events = {}
+        for (step, action, key) in self.events:
+            events.setdefault(step, []).append((action, key))
+        return events
+
+    def length(self) -> int:
+        """Steps from the start to the last event or level change"""
+        last_steps = [step for (step, _, _) in self.events] + \
+            [step for (step, _) in self.levels]
+        return max(last_steps, default=-1) + 1
+
+    def save(self, path: str) -> None:
+        data = {"version": REPLAY_VERSION,
+                "seed": self.seed,
+                "start_level": self.start_level,
+                "events": self.events,
+                "levels": self.levels}
+        with gzip.open(path, "wt") as replay_file:
+            json.dump(data, replay_file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str):
+        with gzip.open(path, "rt") as replay_file:
+            data = json.load(replay_file)
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"{path}: unsupported replay version "
+                             f"{data.get('version')}")
+        return cls(data["seed"], data["start_level"],
+                   [tuple(event) for event in data["events"]],
+                   [tuple(level) for level in data["levels"]])
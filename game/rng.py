@@ -0,0 +1,48 @@
+import random
+
+
+class RandomStreams:
+    """
+    All of the game's randomness, as named streams (e.g. one for placing
+    sprites, one for wasps). Each stream is seeded from the game seed and
+    its own name, so the same seed always gives the same run and drawing
+    more from one stream never changes what another one draws.
+    """
+    def __init__(self, seed: int = None):
+        self.reseed(seed)
+
+    def reseed(self, seed: int = None) -> None:
+        """Start every stream over from seed (a new random seed if None)"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.streams = {}
+
+    def stream(self, name: str) -> random.Random:
+        if name not in self.streams:
+            # str seeds are hashed with sha512, so this is the same in
+            # every run (unlike hash(), which is randomized per process)
+            self.streams[name] = random.Random(f"{self.seed}:{name}")
+        return self.streams[name]
+
+    def __getitem__(self, name: str) -> random.Random:
+        return self.stream(name)
+
+
+def randranges(rng: random.Random, count: int, start: int,
+               stop: int) -> list:
+    """
+    count random ints in range(start, stop), drawn in one go (much cheaper
+    than count calls to rng.randrange)
+    """
+    draw = rng.random
+    span = stop - start
+    return [start + int(draw() * span) for _ in range(count)]
+
+
+def uniforms(rng: random.Random, count: int, low: float,
+             high: float) -> list:
+    """count random floats between low and high, drawn in one go"""
+    draw = rng.random
+    span = high - low
+    return [low + draw() * span for _ in range(count)]
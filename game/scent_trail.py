@@ -0,0 +1,45 @@
+class ScentTrail:
+    """
+    Scent sprites of a trail, oldest (lowest on the map) first, kept in a
+    ring of sprites made up front. New scents always spawn above the
+    screen top, so the oldest scent is also the lowest one and the trail
+    never needs searching or sorting.
+    """
+    def __init__(self, factory, capacity: int):
+        self.slots = [factory() for _ in range(capacity)]
+        self.first = 0  # slot of the oldest scent
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        """Scents, oldest first"""
+        for i in range(self.count):
+            yield self.slots[(self.first + i) % len(self.slots)]
+
+    def oldest(self):
+        return self.slots[self.first] if self.count else None
+
+    def newest(self):
+        if not self.count:
+            return None
+        return self.slots[(self.first + self.count - 1) % len(self.slots)]
+
+    def push(self):
+        """Returns a free scent sprite as the newest scent (None if full)"""
+        if self.count == len(self.slots):
+            return None
+        self.count += 1
+        return self.newest()
+
+    def pop(self):
+        """Removes the oldest scent and returns its sprite for reuse"""
+        scent = self.slots[self.first]
+        self.first = (self.first + 1) % len(self.slots)
+        self.count -= 1
+        return scent
+
+    def clear(self) -> None:
+        self.first = 0
+        self.count = 0
@@ -0,0 +1,27 @@
+import arcade
+import game.constants as c
+
+
+class FadeSection(arcade.Section):
+    """
+    Black overlay drawn over the whole window (above every other section),
+    used by the game view to fade out of one level and into the next.
+    """
+    def __init__(self, left: int = 0, bottom: int = 0,
+                 width: int = c.SCREEN_WIDTH,
+                 height: int = c.SCREEN_HEIGHT,
+                 **kwargs):
+        super().__init__(left, bottom, width, height,
+                         accept_keyboard_events=False, **kwargs)
+
+        self.name = "fade"
+        self.alpha = 0  # 0 = transparent, 255 = screen fully black
+        self.camera = arcade.Camera(self.window.width, self.window.height,
+                                    self.window)
+
+    def on_draw(self):
+        if self.alpha > 0:
+            self.camera.use()  # levels may have scrolled their own camera
+            arcade.draw_lrtb_rectangle_filled(0, c.SCREEN_WIDTH,
+                                              c.SCREEN_HEIGHT, 0,
+                                              (0, 0, 0, self.alpha))
@@ -1,9 +1,17 @@
 
+import logging
 import arcade
 import game.constants as c
-from game.sprites import Player, BeeEnemy, BeeFriend, Honey
-import random
-import time
+from game.textures import load_texture
+from game.audio import play_sound
+from game.sprites import (Player, BeeEnemy, BeeFriend, Honey,
+                          add_sprite_lists)
+from game.placement import SpritePlacer, PlacementError
+from game.crowd import BeeCrowd
+from game.controls import InputController
+from game.rng import randranges
+
+log = logging.getLogger(__name__)
 
 
 class HiveSection(arcade.Section):
@@ -11,68 +19,110 @@ class HiveSection(arcade.Section):
                  **kwargs):
         super().__init__(left, bottom, width, height, **kwargs)
 
-    def randomly_position_sprite(self, sprite: arcade.Sprite) -> None:
-        """Move sprite to a random position (until no collisions detected)."""
-        sprite.center_x = random.randint(c.PADDING,
-                                         (c.SCREEN_WIDTH - c.PADDING))
-        sprite.center_y = random.randint(c.PADDING + c.INFO_BAR_HEIGHT,
-                                         (c.SCREEN_HEIGHT - c.PADDING))
-        while arcade.check_for_collision_with_lists(sprite,
-                                                    self.scene.sprite_lists):
-            sprite.center_x = random.randint(c.PADDING, (c.SCREEN_WIDTH - c.PADDING))
-            sprite.center_y = random.randint(c.PADDING + c.INFO_BAR_HEIGHT,
-                                             (c.SCREEN_HEIGHT - c.PADDING))
+        # Set by the level registry when it makes the level (see levels.py)
+        self.name = None
+        self.transitions = {}  # e.g. "next": name of next level
+        self.previous_level = None
+        self.next_level = None
+        self.spawns = {}  # how many of each sprite to spawn
+        self.sprite_list_specs = []  # sprite lists in the scene (in order)
+
+    def setup(self):
+        """Sets up the whole scene at once (see setup_steps)"""
+        for _ in self.setup_steps():
+            pass
+
+    def setup_steps(self):
+        """
+        Sets up the scene, yielding between steps so the game view can
+        spread the work over several frames while another level is running.
+        Must not touch the (shared) player, that is left to enter()
+        """
+        yield
+
+    def reset(self):
+        """Resets the whole scene at once (see reset_steps)"""
+        for _ in self.reset_steps():
+            pass
+
+    def reset_steps(self):
+        """
+        Puts an already set up scene back to how a fresh one would start
+        (so the level can be played again without being rebuilt), reusing
+        its sprites, sprite lists and camera. Yields like setup_steps()
+        """
+        yield
+
+    def enter(self) -> None:
+        """Called as the level becomes the current level"""
+        # keys held through the level change keep the player moving
+        self.view.controls.subscribe(self.on_controls_changed)
+        self.on_controls_changed(self.view.controls)
+
+    def leave(self, next_level: str) -> None:
+        """Called as the level stops being the current level"""
+        self.view.controls.unsubscribe(self.on_controls_changed)
+        self.player.remove_from_sprite_lists()
+
+    def on_controls_changed(self, controls: InputController) -> None:
+        """Player's speed and facing, from the direction held"""
+        (x, y) = controls.direction
+        self.player.change_x = x * c.PLAYER_MOVE_SPEED
+        self.player.change_y = y * c.PLAYER_MOVE_SPEED
+        if controls.angle is not None:
+            self.player.angle = controls.angle
+        self.player.walking = controls.walking
+
+    def on_fixed_update(self, delta_time: float):
+        """
+        Advances the level by one fixed step of delta_time. Called by the
+        game view (as often as needed to keep up with real time), instead
+        of on_update being called once per drawn frame
+        """
+        pass
+
+    def new_placer(self) -> SpritePlacer:
+        """Placer for positioning sprites anywhere inside the hive"""
+        return SpritePlacer(c.PADDING, c.PADDING + c.INFO_BAR_HEIGHT,
+                            c.SCREEN_WIDTH - c.PADDING,
+                            c.SCREEN_HEIGHT - c.PADDING,
+                            cell_size=c.PLACEMENT_CELL_SIZE,
+                            attempts=c.PLACEMENT_ATTEMPTS,
+                            rng=self.window.rng["placement"])
+
+    def random_angles(self, count: int) -> list:
+        """Starting angles for count bees"""
+        return randranges(self.window.rng["bees"], count, 0, 360)
+
+    def randomly_position_sprite(self, sprite: arcade.Sprite,
+                                 obstacle: bool = True) -> bool:
+        """
+        Move sprite to a random position not overlapping any sprite placed
+        before it (by self.placer). If obstacle, later sprites avoid it too.
+        Returns False (and leaves sprite where it was) if there's no room
+        """
+        radius = max(sprite.width, sprite.height) / 2
+        try:
+            sprite.position = self.placer.random_position(radius, obstacle)
+        except PlacementError as error:
+            log.warning("%s not placed in %s: %s",
+                        type(sprite).__name__, self.name, error)
+            return False
+        return True
 
     def on_key_press(self, key: int, modifiers: int):
         """Key press behavior for hive scene"""
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.up_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.down_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.right_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.left_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.SPACE]:
-            shadow = arcade.load_texture("assets/sprites/bee_shadow1.png")
+        if key in [arcade.key.SPACE]:
+            shadow = load_texture(c.PLAYER_SHADOW_IMAGE)
             self.player.texture = shadow
             self.player.flying = True
 
     def on_key_release(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.player.change_y = 0
-            self.up_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.player.change_y = 0
-            self.down_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.player.change_x = 0
-            self.right_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.player.change_x = 0
-            self.left_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.SPACE]:
+        if key in [arcade.key.SPACE]:
             self.player.flying = False
-            self.player.texture = arcade.load_texture(
-                "assets/sprites/bee_player_move1_2.png")
-        self.player.walking = False
-
-    def reset_controls(self):
-        self.scene_over = True
-        self.up_pressed = False
-        self.down_pressed = False
-        self.right_pressed = False
-        self.left_pressed = False
+            self.player.texture = load_texture(c.PLAYER_SPRITE_IMAGE)
 
     def enforce_screen_edge_for_sprite(self, sprite: Player):
         """Prevent (player) sprite going past screen edge"""
@@ -97,72 +147,69 @@ class HomeSection(HiveSection):
                  **kwargs):
         super().__init__(left, bottom, width, height, **kwargs)
 
-        self.name = "home"
+        self.moving_sprite_lists = ["Player"]  # lists needing update()
         self.exit_hole = c.EXIT_HOLE_PINK
         self.scene = arcade.Scene()
         self.scene_over = False  # whether done with this scene (trigger)
         self.player: Player = self.window.player  # save same player b/t views
         self.physics_engine = None
-        self.sounds = {
-            "hurt": arcade.load_sound("assets/sounds/hurt.wav"),
-            "honey": arcade.load_sound("assets/sounds/honey.wav"),
-            "background": arcade.load_sound(
-                "assets/sounds/background.wav", streaming=True),
-            "jump": arcade.load_sound("assets/sounds/jump.wav")
-        }
         self.camera = arcade.Camera(self.window.width, self.window.height,
                                     self.window)
 
-        self.previous_level = "outside_return"
-        self.next_level = "outside_leave"
-
-        self.setup()
-
-    def setup(self):
+    def setup_steps(self):
         """Sets up a hive scene"""
 
-        arcade.set_background_color(c.BACKGROUND_COLOR)
-        self.background = arcade.load_texture(c.HOME_BACKGROUND)
+        self.background = load_texture(c.HOME_BACKGROUND)
+        self.placer = self.new_placer()
         self.setup_all_sprites()
-        self.setup_key_press_state()
         self.physics_engine = arcade.PhysicsEngineSimple(
             self.player, self.scene.name_mapping["Walls"]
         )
+        yield
+
+    def reset_steps(self):
+        self.placer = self.new_placer()
+        for exit_hole in self.scene["Exits"]:
+            self.randomly_position_sprite(exit_hole)
+        bees = self.scene["Bees"]
+        for bee, angle in zip(bees, self.random_angles(len(bees))):
+            self.randomly_position_sprite(bee)
+            bee.angle = angle
+        yield
+
+    def enter(self) -> None:
+        arcade.set_background_color(c.BACKGROUND_COLOR)
+        self.setup_player()
+        super().enter()
 
     def setup_all_sprites(self):
         self.setup_all_sprite_lists()
-        self.setup_player()
         self.setup_exit_sprite()
         self.setup_bee_sprites()
 
     def setup_all_sprite_lists(self):
-        self.scene.add_sprite_list("Walls")  # , use_spatial_hash=True)
-        self.scene.add_sprite_list("Exits")
-        self.scene.add_sprite_list("Player")
-        self.scene.add_sprite_list("Bees")
+        add_sprite_lists(self.scene, self.sprite_list_specs)
 
     def setup_player(self) -> None:
         self.randomly_position_sprite(self.player)
         self.scene.add_sprite("Player", self.player)
 
     def setup_exit_sprite(self):
-        exit_hole = arcade.Sprite(self.exit_hole,
+        exit_hole = arcade.Sprite(texture=load_texture(self.exit_hole),
                                   scale=1)
         self.randomly_position_sprite(exit_hole)
         self.scene.add_sprite("Exits", exit_hole)
 
     def setup_bee_sprites(self):
-        for i in range(c.BEE_FRIEND_COUNT):
+        for angle in self.random_angles(self.spawns["bees"]):
             bee = BeeFriend(c.BEE_FRIEND_IMAGE, c.BEE_FRIEND_SCALING)
-            self.randomly_position_sprite(bee)
-            bee.angle = random.randrange(0, 360)
+            if not self.randomly_position_sprite(bee):
+                continue  # hive is full, leave the bee out
+            bee.angle = angle
             self.scene.add_sprite("Bees", bee)
-
-    def setup_key_press_state(self) -> None:
-        self.left_pressed = False
-        self.right_pressed = False
-        self.up_pressed = False
-        self.down_pressed = False
+        self.crowd = BeeCrowd(self.scene["Bees"], c.BEE_FRIEND_ROTATE_CHANCE,
+                              turn=(0, 360), relative=False,
+                              rng=self.window.rng["crowd"])
 
     def on_draw(self):
         """Draws hive scene"""
@@ -178,80 +225,36 @@ class HomeSection(HiveSection):
 
     def on_key_press(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.up_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.down_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.right_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.left_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.ENTER]:
+        if key in [arcade.key.ENTER]:
             if c.DEBUG:
                 self.change_level(self.next_level)
         elif key in [arcade.key.BACKSPACE]:
             if c.DEBUG:
                 self.change_level(self.previous_level)
+        elif key in [c.PERF_OVERLAY_KEY, c.PERF_DUMP_KEY]:
+            if c.DEBUG:
+                self.view.on_profiler_key(key)
 
-    def update_player_speed(self):
-
-        # Calculate speed based on the keys pressed
-        self.player.change_x = 0
-        self.player.change_y = 0
-
-        if self.up_pressed and not any([self.down_pressed,
-                                        self.left_pressed,
-                                        self.right_pressed]):
-            self.player.change_y = c.PLAYER_MOVE_SPEED
-            self.player.angle = 0
-            self.player.walking = True
-        elif self.down_pressed and not any([self.up_pressed,
-                                            self.left_pressed,
-                                            self.right_pressed]):
-            self.player.change_y = -c.PLAYER_MOVE_SPEED
-            self.player.angle = 180
-            self.player.walking = True
-        if self.left_pressed and not any([self.up_pressed,
-                                          self.down_pressed,
-                                          self.right_pressed]):
-            self.player.change_x = -c.PLAYER_MOVE_SPEED
-            self.player.angle = 90
-            self.player.walking = True
-        elif self.right_pressed and not any([self.up_pressed,
-                                            self.down_pressed,
-                                            self.left_pressed]):
-            self.player.change_x = c.PLAYER_MOVE_SPEED
-            self.player.angle = 270
-            self.player.walking = True
-
-    def on_update(self, delta_time: float):
+    def on_fixed_update(self, delta_time: float):
 
         if self.player_is_touching_exit():
-            self.change_level("outside_leave")
+            self.change_level(self.next_level)
 
         self.update_player()
         self.update_all_sprites()
         self.physics_engine.update()
 
     def change_level(self, level_name: str) -> None:
-        self.reset_controls()  # ignore pressed controls between scenes
         self.view.intro_complete = True
         self.view.change_level(level_name)
 
     def update_all_sprites(self):
-        for sprite_list in self.scene.sprite_lists:
-            sprite_list.update()
-        for bee in self.scene.get_sprite_list("Bees"):
-            bee.update_animation()
-        self.randomly_rotate_bee_srites()
+        for name in self.moving_sprite_lists:  # others don't move
+            self.scene[name].update()
+        self.crowd.update()
         self.player.update_animation()
 
     def update_player(self):
-        self.update_player_walking_status()
         self.enforce_screen_edge_for_sprite(self.player)
 
     def player_is_touching_exit(self) -> bool:
@@ -260,18 +263,6 @@ class HomeSection(HiveSection):
             return True
         return False
 
-    def update_player_walking_status(self):
-        if any([self.up_pressed, self.down_pressed,
-                self.left_pressed, self.right_pressed]):
-            self.player.walking = True
-        else:
-            self.player.walking = False
-
-    def randomly_rotate_bee_srites(self):
-        for bee in self.scene["Bees"]:
-            if random.randint(0, 30) == 30:
-                bee.angle = random.randrange(0, 360)
-
 
 class ForeignHiveSection(HiveSection):
     """
@@ -286,99 +277,106 @@ class ForeignHiveSection(HiveSection):
                  **kwargs):
         super().__init__(left, bottom, width, height, **kwargs)
 
-        self.name = "foreign_hive"
+        self.moving_sprite_lists = ["Player"]  # lists needing update()
         self.scene = arcade.Scene()
         self.player: Player = self.window.player
         self.physics_engine = None
-        self.sounds = {
-            "hurt": arcade.load_sound("assets/sounds/hurt.wav"),
-            "honey": arcade.load_sound("assets/sounds/honey.wav"),
-            "background": arcade.load_sound(
-                "assets/sounds/background.wav", streaming=True),
-            "jump": arcade.load_sound("assets/sounds/jump.wav")
-        }
         self.camera = arcade.Camera(self.window.width, self.window.height,
                                     self.window)
         self.time_limit = c.TIME_LIMIT  # when limit reached, level ends
-        self.time_elapsed = 0
-        self.start_time = 0  # time player enters level, in seconds
-
-        self.previous_level = "outside_leave"
-        self.next_level = "outside_return"
-
-        self.setup()
+        self.time_elapsed = 0  # game time since player entered level
+        self.time_left = None  # seconds currently shown by timer_text
+        self.timer_text = None  # made on first draw (needs an OpenGL context)
 
-    def setup(self):
+    def setup_steps(self):
         """Sets up a hive scene"""
 
-        self.start_time = time.time()
-
         self.exit_hole = c.EXIT_HOLE_YELLOW
 
-        arcade.set_background_color(c.BACKGROUND_COLOR)
-        self.background = arcade.load_texture(c.BACKGROUND_IMAGE)
-
-        # Background Sound Track
-        # arcade.play_sound(self.sounds["background"], looping=True)
+        self.background = load_texture(c.BACKGROUND_IMAGE)
 
-        # Create sprite lists
-        self.scene.add_sprite_list("Walls")  # , use_spatial_hash=True)
-        self.scene.add_sprite_list("Exits")
-        self.scene.add_sprite_list("Player")
-        self.scene.add_sprite_list("Honey")
-        self.scene.add_sprite_list("Bees")
+        # Only the exit is an obstacle, bees and honey can be on top of
+        # each other (so there's room for thousands of bees)
+        self.placer = self.new_placer()
 
-        # Track the current state of what key is pressed
-        self.left_pressed = False
-        self.right_pressed = False
-        self.up_pressed = False
-        self.down_pressed = False
+        # Create sprite lists. Honey and bees (mostly) stay put, so they're
+        # indexed in a spatial hash: player collision checks then only test
+        # sprites in nearby cells (kept up to date by arcade as bees rotate
+        # or honey is taken)
+        add_sprite_lists(self.scene, self.sprite_list_specs)
 
         # Create and place exit hole
-        exit_hole = arcade.Sprite(self.exit_hole,
+        exit_hole = arcade.Sprite(texture=load_texture(self.exit_hole),
                                   scale=1)
         self.randomly_position_sprite(exit_hole)
         self.scene.add_sprite("Exits", exit_hole)
 
-        # Create and position player
-        self.randomly_position_sprite(self.player)
-        self.scene.add_sprite("Player", self.player)
-
         # Create honey drops with random position and angle, then add to list
-        for i in range(c.HONEY_SPRITE_COUNT):
+        # (all drops kept, so collected ones can be put back on a reset)
+        self.honey_drops = []
+        for i in range(self.spawns["honey"]):
             honey = Honey(c.HONEY_SPRITE_IMAGE, c.HONEY_SPRITE_SCALING)
-            self.randomly_position_sprite(honey)
+            if not self.randomly_position_sprite(honey, obstacle=False):
+                continue
             self.scene.add_sprite("Honey", honey)
+            self.honey_drops.append(honey)
+        yield
 
         # Create bees with random position and angle, then add to list
-        for i in range(c.BEE_ENEMY_COUNT):
+        for i, angle in enumerate(self.random_angles(self.spawns["bees"])):
             bee = BeeEnemy(c.BEE_ENEMY_IMAGE, c.BEE_ENEMY_SCALING)
-            self.randomly_position_sprite(bee)
-            bee.angle = random.randrange(0, 360)
-            self.scene.add_sprite("Bees", bee)
+            if self.randomly_position_sprite(bee, obstacle=False):
+                bee.angle = angle
+                self.scene.add_sprite("Bees", bee)
+            if i % c.SETUP_BATCH_SIZE == c.SETUP_BATCH_SIZE - 1:
+                yield
+        self.crowd = BeeCrowd(self.scene["Bees"], c.BEE_ROTATE_CHANCE,
+                              idle_texture=load_texture(c.BEE_ENEMY_IMAGE),
+                              flutter_texture=load_texture(
+                                  c.BEE_ENEMY_MOVING_2),
+                              rng=self.window.rng["crowd"])
 
         # Set and apply physics engine
         # self.physics_engine = arcade.PhysicsEnginePlatformer(
         self.physics_engine = arcade.PhysicsEngineSimple(
             self.player, self.scene.name_mapping["Walls"]
         )
+        yield
 
-    def randomly_position_sprite(self, sprite: arcade.Sprite) -> None:
-        """Move sprite to a random position (until no collisions detected)."""
-        sprite.center_x = random.randint(c.PADDING,
-                                         (c.SCREEN_WIDTH - c.PADDING))
-        sprite.center_y = random.randint(c.PADDING + c.INFO_BAR_HEIGHT,
-                                         (c.SCREEN_HEIGHT - c.PADDING))
-        while arcade.check_for_collision_with_lists(sprite,
-                                                    [
-                                                     self.scene.
-                                                     get_sprite_list("Exits")
-                                                     ]
-                                                    ):
-            sprite.center_x = random.randint(c.PADDING + c.INFO_BAR_HEIGHT,
-                                             (c.SCREEN_WIDTH - c.PADDING))
-            sprite.center_y = random.randint(c.PADDING,
-                                             (c.SCREEN_HEIGHT - c.PADDING))
+    def reset_steps(self):
+        self.time_elapsed = 0
+        self.placer = self.new_placer()
+        for exit_hole in self.scene["Exits"]:
+            self.randomly_position_sprite(exit_hole)
+
+        # Put back collected honey
+        honey_list = self.scene["Honey"]
+        for honey in self.honey_drops:
+            if honey not in honey_list:
+                honey_list.append(honey)
+            self.randomly_position_sprite(honey, obstacle=False)
+        yield
+
+        self.crowd.reset()
+        bees = self.scene["Bees"]
+        angles = self.random_angles(len(bees))
+        for i, bee in enumerate(bees):
+            self.randomly_position_sprite(bee, obstacle=False)
+            bee.angle = angles[i]
+            if i % c.SETUP_BATCH_SIZE == c.SETUP_BATCH_SIZE - 1:
+                yield
+
+    def enter(self) -> None:
+        self.time_elapsed = 0
+        arcade.set_background_color(c.BACKGROUND_COLOR)
+
+        # Background Sound Track
+        # play_music()
+
+        # Position player
+        self.randomly_position_sprite(self.player, obstacle=False)
+        self.scene.add_sprite("Player", self.player)
+        super().enter()
 
     def on_draw(self):
         """Draws hive scene"""
@@ -394,74 +392,39 @@ class ForeignHiveSection(HiveSection):
         self.display_timer()
 
     def display_timer(self):
+        if self.timer_text is None:
+            self.timer_text = arcade.Text("", start_x=c.SCREEN_WIDTH-165,
+                                          start_y=c.SCREEN_HEIGHT-30,
+                                          color=arcade.color.SCARLET,
+                                          font_size=15, width=20,
+                                          align='left', bold=True)
         time_left = int(self.time_limit - self.time_elapsed)
-        arcade.draw_text("TIME LEFT: " + str(time_left),
-                         start_x=c.SCREEN_WIDTH-165,
-                         start_y=c.SCREEN_HEIGHT-30,
-                         color=arcade.color.SCARLET,
-                         font_size=15, width=20, align='left',
-                         bold=True)
+        if time_left != self.time_left:  # only lay out text once a second
+            self.time_left = time_left
+            self.timer_text.text = "TIME LEFT: " + str(time_left)
+        self.timer_text.draw()
 
     def on_key_press(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.up_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.down_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.right_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.left_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.ENTER]:
+        if key in [arcade.key.ENTER]:
             if c.DEBUG:
                 self.change_level(self.next_level)
         elif key in [arcade.key.BACKSPACE]:
             if c.DEBUG:
                 self.change_level(self.previous_level)
+        elif key in [c.PERF_OVERLAY_KEY, c.PERF_DUMP_KEY]:
+            if c.DEBUG:
+                self.view.on_profiler_key(key)
 
-    def on_key_release(self, key: int, modifiers: int):
-        """Key release behavior"""
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.player.change_y = 0
-            self.up_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.player.change_y = 0
-            self.down_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.player.change_x = 0
-            self.right_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.player.change_x = 0
-            self.left_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.SPACE]:
-            self.player.flying = False
-            self.player.texture = arcade.load_texture(
-                "assets/sprites/bee_player_move1_2.png")
-        self.player.walking = False
-
-    def reset_controls(self):
-        self.scene_over = True
-        self.up_pressed = False
-        self.down_pressed = False
-        self.right_pressed = False
-        self.left_pressed = False
-
-    def on_update(self, delta_time: float):
+    def on_fixed_update(self, delta_time: float):
         """
-        Called every delta_time (default 1/60, i.e. 60 FPS)
+        Called every fixed step (delta_time is always c.FIXED_TIMESTEP)
         """
+        self.time_elapsed += delta_time
         if self.timer_has_elapsed():
-            self.change_level("outside_return")
+            self.change_level(self.next_level)
         if self.player_is_touching_exit():
-            self.change_level("outside_return")
+            self.change_level(self.next_level)
 
         self.update_player()
         self.handle_player_touching_honey()
@@ -474,64 +437,17 @@ class ForeignHiveSection(HiveSection):
 
     def timer_has_elapsed(self):
         # If time limit reached, player is forced to next level
-        if self.time_elapsed >= self.time_limit:
-            return True
-        else:
-            self.timer_reset()
-            return False
-
-    def timer_reset(self):
-        self.time_elapsed = time.time() - self.start_time
+        return self.time_elapsed >= self.time_limit
 
     def update_all_sprites(self):
-        for sprite_list in self.scene.sprite_lists:
-            sprite_list.update()
-        for bee in self.scene.get_sprite_list("Bees"):
-            bee.update_animation()
+        for name in self.moving_sprite_lists:  # others don't move
+            self.scene[name].update()
+        self.crowd.update()
         self.player.update_animation()
 
     def update_player(self):
-        self.update_player_walking_status()
         self.enforce_screen_edge_for_sprite(self.player)
 
-    def update_player_walking_status(self):
-        if any([self.up_pressed, self.down_pressed,
-                self.left_pressed, self.right_pressed]):
-            self.player.walking = True
-        else:
-            self.player.walking = False
-
-    def update_player_speed(self):
-
-        # Calculate speed based on the keys pressed
-        self.player.change_x = 0
-        self.player.change_y = 0
-
-        if self.up_pressed and not any([self.down_pressed,
-                                        self.left_pressed,
-                                        self.right_pressed]):
-            self.player.change_y = c.PLAYER_MOVE_SPEED
-            self.player.angle = 0
-            self.player.walking = True
-        elif self.down_pressed and not any([self.up_pressed,
-                                            self.left_pressed,
-                                            self.right_pressed]):
-            self.player.change_y = -c.PLAYER_MOVE_SPEED
-            self.player.angle = 180
-            self.player.walking = True
-        elif self.left_pressed and not any([self.up_pressed,
-                                           self.down_pressed,
-                                           self.right_pressed]):
-            self.player.change_x = -c.PLAYER_MOVE_SPEED
-            self.player.angle = 90
-            self.player.walking = True
-        elif self.right_pressed and not any([self.up_pressed,
-                                            self.down_pressed,
-                                            self.left_pressed]):
-            self.player.change_x = c.PLAYER_MOVE_SPEED
-            self.player.angle = 270
-            self.player.walking = True
-
     def player_is_touching_exit(self) -> bool:
         if arcade.check_for_collision_with_list(
                 self.player, self.scene.name_mapping["Exits"]):
@@ -546,7 +462,7 @@ class ForeignHiveSection(HiveSection):
         collision_list = arcade.check_for_collision_with_list(
                                 self.player, self.scene.name_mapping["Honey"])
         for honey in collision_list:
-            arcade.play_sound(self.sounds["honey"])
+            play_sound("honey")
             honey.remove_from_sprite_lists()
             self.player.score += 1
 
@@ -554,6 +470,4 @@ class ForeignHiveSection(HiveSection):
         """If player collides with a bee sprite, bee will flutter it's wings"""
         collisions: list[BeeEnemy] = arcade.check_for_collision_with_list(
             self.player, self.scene.get_sprite_list("Bees"))
-        if collisions:
-            for bee in collisions:
-                bee.fluttering = True
+        self.crowd.flutter(collisions)
@@ -2,11 +2,49 @@
 import arcade
 import game.constants as c
 import json
+import os
+from types import MappingProxyType
 
 
 MESSAGES_JSON = 'game/messages.json'
 
 
+class MessageTable:
+    """
+    Read-only table of the game's messages, loaded once from a json file.
+    In DEBUG mode, poll() reloads it whenever the file is changed.
+    """
+    def __init__(self, path: str = MESSAGES_JSON):
+        self.path = path
+        self.mtime = None
+        self.since_poll = 0.  # seconds since file was last checked
+        self.messages = MappingProxyType({})
+        self.load()
+
+    def load(self) -> None:
+        self.mtime = os.path.getmtime(self.path)
+        with open(self.path) as messages_file:
+            self.messages = MappingProxyType(json.load(messages_file))
+
+    def poll(self, delta_time: float) -> None:
+        """Reload messages if json file changed (checked every interval)"""
+        self.since_poll += delta_time
+        if self.since_poll < c.MESSAGES_POLL_INTERVAL:
+            return
+        self.since_poll = 0.
+        try:
+            if os.path.getmtime(self.path) != self.mtime:
+                self.load()
+        except (OSError, ValueError):  # file mid-save, try again next poll
+            pass
+
+    def __getitem__(self, msg_name: str) -> str:
+        return self.messages[msg_name]
+
+
+messages = MessageTable()  # shared by every InfoBar
+
+
 class InfoBar(arcade.Section):
     """
     arcade section for bottom of screen
@@ -24,54 +62,72 @@ class InfoBar(arcade.Section):
         self.char_index = -1  # used by animated typed messages
         self.player = self.window.player
 
+        # Retained shapes and text: only laid out again if contents change.
+        # Made on first draw (they need an OpenGL context)
+        self.panel = None
+        self.message_text = None
+        self.score = None  # score currently shown by score_text
+        self.score_text = None
+
+    def create_draw_objects(self) -> None:
+        self.panel = arcade.ShapeElementList()
+        self.panel.append(arcade.create_rectangle_filled(
+            c.SCREEN_WIDTH / 2, c.INFO_BAR_HEIGHT / 2,
+            c.SCREEN_WIDTH, c.INFO_BAR_HEIGHT, arcade.color.EERIE_BLACK))
+        self.panel.append(arcade.create_rectangle_outline(
+            c.SCREEN_WIDTH / 2, c.INFO_BAR_HEIGHT / 2,
+            c.SCREEN_WIDTH, c.INFO_BAR_HEIGHT, arcade.color.ANTIQUE_WHITE,
+            border_width=5))
+        self.message_text = arcade.Text("", start_x=50, start_y=115,
+                                        font_size=15, font_name="arial",
+                                        bold=True, multiline=True,
+                                        width=700, align="center",
+                                        color=(250, 235, 215, 255))
+        self.score_text = arcade.Text("", start_x=c.SCREEN_WIDTH-140,
+                                      start_y=20,
+                                      color=arcade.color.GOLDEN_YELLOW,
+                                      font_size=15, width=25, align='left',
+                                      bold=True)
+
     def on_draw(self):
-        arcade.draw_lrtb_rectangle_filled(0, c.SCREEN_WIDTH,
-                                          c.INFO_BAR_HEIGHT, 0,
-                                          arcade.color.EERIE_BLACK)
-        arcade.draw_lrtb_rectangle_outline(0, c.SCREEN_WIDTH,
-                                           c.INFO_BAR_HEIGHT, 0,
-                                           arcade.color.ANTIQUE_WHITE,
-                                           border_width=5)
+        if self.panel is None:
+            self.create_draw_objects()
+        self.panel.draw()
         self.print_message(self.view.get_level_name())
         self.display_score()
 
+    def on_update(self, delta_time: float):
+        if c.DEBUG:
+            messages.poll(delta_time)  # hot reload edits to messages.json
+
     def get_message(self, msg_name: str) -> str:
         """Takes name of message and returns message str from json file"""
-        messages_file = open(MESSAGES_JSON)
-        messages = json.load(messages_file)
 
         # Intro message is typed out, not displayed at once
         if msg_name == "intro":
             if self.char_index // c.TYPING_SPEED < len(messages[msg_name]):
                 self.char_index += 1
-            messages_file.close()
             return messages[msg_name][0:self.char_index//c.TYPING_SPEED]
 
         # Other messsages are returned as entire string at once
-        messages_file.close()
         return messages[msg_name]
 
     def print_message(self, msg_name: str) -> None:
 
         # Print game introduction message
         if not self.view.intro_complete:
-            arcade.draw_text(self.get_message("intro"),
-                             start_x=50, start_y=115, font_size=15,
-                             font_name="arial", bold=True, multiline=True,
-                             width=700, align="center",
-                             color=(250, 235, 215, 255))
+            message = self.get_message("intro")
 
         # Print regular message
         else:
-            arcade.draw_text(self.get_message(msg_name),
-                             start_x=50, start_y=115, font_size=15,
-                             font_name="arial", bold=True, multiline=True,
-                             width=700, align="center",
-                             color=(250, 235, 215, 255))
+            message = self.get_message(msg_name)
+
+        if message != self.message_text.text:  # e.g. a new typed character
+            self.message_text.text = message
+        self.message_text.draw()
 
     def display_score(self):
-        arcade.draw_text("Honey: " + str(self.player.score),
-                         start_x=c.SCREEN_WIDTH-140, start_y=20,
-                         color=arcade.color.GOLDEN_YELLOW,
-                         font_size=15, width=25, align='left',
-                         bold=True)
+        if self.player.score != self.score:
+            self.score = self.player.score
+            self.score_text.text = "Honey: " + str(self.score)
+        self.score_text.draw()
@@ -0,0 +1,27 @@
+import arcade
+import game.constants as c
+from game.controls import InputController
+
+
+class InputSection(arcade.Section):
+    """
+    Invisible section, ahead of the level for key events, that keeps the
+    game view's InputController up to date (then lets the key on to the
+    level, for its other keys)
+    """
+    def __init__(self, controls: InputController, left: int = 0,
+                 bottom: int = 0, width: int = c.SCREEN_WIDTH,
+                 height: int = c.SCREEN_HEIGHT, **kwargs):
+        super().__init__(left, bottom, width, height,
+                         accept_keyboard_events=True,
+                         prevent_dispatch={False},
+                         prevent_dispatch_view={False}, **kwargs)
+
+        self.name = "input"
+        self.controls = controls
+
+    def on_key_press(self, key: int, modifiers: int):
+        self.controls.press(key)
+
+    def on_key_release(self, key: int, modifiers: int):
+        self.controls.release(key)
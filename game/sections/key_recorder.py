@@ -0,0 +1,26 @@
+import arcade
+import game.constants as c
+from game.replay import Recording, PRESS, RELEASE
+
+
+class KeyRecorder(arcade.Section):
+    """
+    Invisible section, first in line for key events, that notes each one
+    in a Recording (then lets it on to the level as usual)
+    """
+    def __init__(self, recording: Recording, left: int = 0, bottom: int = 0,
+                 width: int = c.SCREEN_WIDTH, height: int = c.SCREEN_HEIGHT,
+                 **kwargs):
+        super().__init__(left, bottom, width, height,
+                         accept_keyboard_events=True,
+                         prevent_dispatch={False},
+                         prevent_dispatch_view={False}, **kwargs)
+
+        self.name = "key_recorder"
+        self.recording = recording
+
+    def on_key_press(self, key: int, modifiers: int):
+        self.recording.add_event(self.view.steps_run, PRESS, key)
+
+    def on_key_release(self, key: int, modifiers: int):
+        self.recording.add_event(self.view.steps_run, RELEASE, key)
@@ -1,8 +1,13 @@
 
 import arcade
 import game.constants as c
-from game.sprites import Player, Wasp, Scent
-import random
+from game.textures import load_texture
+from game.backgrounds import TiledBackground
+from game.sprites import Player, Wasp, Scent, add_sprite_lists
+from game.pool import SpritePool
+from game.scent_trail import ScentTrail
+from game.timers import IntervalTimer
+from game.controls import InputController
 from pyglet.math import Vec2
 
 
@@ -12,25 +17,64 @@ class OutsideSection(arcade.Section):
         super().__init__(left, bottom, width, height, **kwargs)
 
         self.camera_scroll_y = c.INFO_BAR_HEIGHT
+        self.camera_y = 0  # where camera is moved to when drawing
 
+        # Set by the level registry when it makes the level (see levels.py)
+        self.name = None
+        self.transitions = {}  # e.g. "next": name of next level
         self.previous_level = None
         self.next_level = None
+        self.spawns = {}  # how many of each sprite to spawn
+        self.sprite_list_specs = []  # sprite lists in the scene (in order)
+
+    def setup(self):
+        """Sets up the whole scene at once (see setup_steps)"""
+        for _ in self.setup_steps():
+            pass
+
+    def setup_steps(self):
+        """
+        Sets up the scene, yielding between steps so the game view can
+        spread the work over several frames while another level is running.
+        Must not touch the (shared) player, that is left to enter()
+        """
+        yield
+
+    def reset(self):
+        """Resets the whole scene at once (see reset_steps)"""
+        for _ in self.reset_steps():
+            pass
+
+    def reset_steps(self):
+        """
+        Puts an already set up scene back to how a fresh one would start
+        (so the level can be played again without being rebuilt), reusing
+        its sprites, sprite lists and camera. Yields like setup_steps()
+        """
+        yield
+
+    def enter(self) -> None:
+        """Called as the level becomes the current level"""
+        self.view.controls.subscribe(self.on_controls_changed)
+        if self.view.controls.walking:  # keys held through level change
+            self.on_controls_changed(self.view.controls)
+
+    def leave(self, next_level: str) -> None:
+        """Called as the level stops being the current level"""
+        self.view.controls.unsubscribe(self.on_controls_changed)
+        self.player.remove_from_sprite_lists()
+
+    def on_fixed_update(self, delta_time: float):
+        """
+        Advances the level by one fixed step of delta_time. Called by the
+        game view (as often as needed to keep up with real time), instead
+        of on_update being called once per drawn frame
+        """
+        pass
 
     def on_key_press(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.up_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.down_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.right_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.left_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.ENTER]:
+        if key in [arcade.key.ENTER]:
             if c.DEBUG:
                 # TODO: pressing enter in debug mode will send to next level
                 pass
@@ -43,52 +87,29 @@ class OutsideSection(arcade.Section):
 
     def on_key_release(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.player.change_y = c.CAMERA_SPEED
-            self.up_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.player.change_y = 0
-            self.down_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.player.change_x = 0
-            self.right_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.player.change_x = 0
-            self.left_pressed = False
-            self.update_player_speed()
-        elif key in [arcade.key.SPACE]:
+        if key in [arcade.key.SPACE]:
             self.player.flying = False
-            self.player.texture = arcade.load_texture(
-                "assets/sprites/bee_player_move1_2.png")
-        self.player.walking = False
+            self.player.texture = load_texture(c.PLAYER_SPRITE_IMAGE)
+
+    def on_controls_changed(self, controls: InputController) -> None:
+        """Player's speed from the direction held (drifting up at rest)"""
 
-    def update_player_speed(self):
-
-        # Calculate speed based on the keys pressed
-        self.player.change_x = 0
-        self.player.change_y = c.CAMERA_SPEED * .50
-
-        # Movement speed * 2 compared to hive speed
-        move_speed_mod = 1.5
-        if self.up_pressed and not any([self.down_pressed,
-                                        self.left_pressed,
-                                        self.right_pressed]):
-            self.player.change_y = c.PLAYER_MOVE_SPEED * move_speed_mod
-        elif self.down_pressed and not any([self.up_pressed,
-                                            self.left_pressed,
-                                            self.right_pressed]):
-            self.player.change_y = -c.PLAYER_MOVE_SPEED * move_speed_mod
-        if self.left_pressed and not any([self.up_pressed,
-                                          self.down_pressed,
-                                          self.right_pressed]):
-            self.player.change_x = -c.PLAYER_MOVE_SPEED * move_speed_mod
-        elif self.right_pressed and not any([self.up_pressed,
-                                            self.down_pressed,
-                                            self.left_pressed]):
-            self.player.change_x = c.PLAYER_MOVE_SPEED * move_speed_mod
+        # Movement speed * 1.5 compared to hive speed
+        move_speed = c.PLAYER_MOVE_SPEED * 1.5
+        (x, y) = controls.direction
+        self.player.change_x = x * move_speed
+        if y:
+            self.player.change_y = y * move_speed
+        else:
+            self.player.change_y = c.CAMERA_SPEED * .50
+        self.player.walking = controls.walking
+
+    def reset_camera(self) -> None:
+        """Back to the start of the map"""
+        self.camera_scroll_y = c.INFO_BAR_HEIGHT
+        self.camera_y = 0
+        self.camera.move_to(Vec2(0, 0), 1.0)
+        self.background.update(self.camera_scroll_y)
 
     def enforce_screen_edge_for_sprite(self, sprite: Player):
         """Prevent (player) sprite going past screen edge"""
@@ -118,29 +139,48 @@ class OutsideLeave(OutsideSection):
                  **kwargs):
         super().__init__(left, bottom, width, height, **kwargs)
 
-        self.name = "outside_leave"
+        self.moving_sprite_lists = ["Player"]  # lists needing update()
         self.scene = arcade.Scene()
         self.player: Player = self.window.player
         self.camera = arcade.Camera(self.window.width, self.window.height)
 
-        self.previous_level = "home"
-        self.next_level = "foreign_hive"
+        self.scent_timer = IntervalTimer(self.place_scent_trail,
+                                         c.SCENT_TRAIL_INTERVAL)
 
-        self.setup()
+    def setup_steps(self):
 
-    def setup(self):
-
-        self.background = arcade.load_texture(
-            c.OUTSIDE_IMAGE, width=800, height=c.OUTSIDE_HEIGHT)
+        self.background = TiledBackground(c.OUTSIDE_IMAGE)
+        self.background.update(self.camera_scroll_y)
+        yield
 
-        self.scene.add_sprite_list("Walls", use_spatial_hash=True)
-        self.setup_key_press_state()
-        self.setup_player()
-        self.scene.add_sprite_list("Scents")
-        self.start_scent_creation_timer()
+        add_sprite_lists(self.scene, self.sprite_list_specs)
         self.physics_engine = arcade.PhysicsEngineSimple(
             self.player, self.scene.name_mapping["Walls"]
         )
+        yield
+
+        # Scent sprites are reused as the trail moves on
+        self.scent_trail = ScentTrail(Scent, self.spawns["scents"])
+        yield
+
+    def reset_steps(self):
+        self.reset_camera()
+        for scent in self.scent_trail:
+            scent.remove_from_sprite_lists()
+        self.scent_trail.clear()
+        yield
+
+    def enter(self) -> None:
+        self.setup_player()
+        self.start_scent_creation_timer()
+        super().enter()
+
+    def leave(self, next_level: str) -> None:
+        super().leave(next_level)
+        self.scent_timer.stop()
+        # keep the tiles at the end of the map, the return trip starts there
+        if next_level != self.next_level:
+            self.background.unload()
 
     def setup_player(self) -> None:
         """Set player attributes and position for this level"""
@@ -156,25 +196,21 @@ class OutsideLeave(OutsideSection):
         self.player.angle = 0
         self.scene.add_sprite("Player", self.player)
 
-    def setup_key_press_state(self) -> None:
-        self.left_pressed = False
-        self.right_pressed = False
-        self.up_pressed = False
-        self.down_pressed = False
-
     def start_scent_creation_timer(self):
-        arcade.schedule(self.place_scent_trail, c.SCENT_TRAIL_INTERVAL)
+        self.scent_timer.start()
 
     def place_scent_trail(self, delta_time: float):
         """
         Trail of scent sprites player must collect to reach next level
-        Note: delta_time arg required for arcade.schedule() method
+        Note: delta_time arg required for IntervalTimer callbacks
         """
         # Place scent sprite position (x = random, y = above screen-top)
         x = self.get_random_x_for_scent()
         y = self.camera_scroll_y + c.SCREEN_HEIGHT + 50
 
-        scent = Scent()
+        scent = self.scent_trail.push()
+        if scent is None:  # trail full, no free scent sprites
+            return
         scent.visible = False  # scent invisible until prev scent collected
         scent.position = (x, y)
         self.scene.add_sprite("Scents", scent)
@@ -183,12 +219,13 @@ class OutsideLeave(OutsideSection):
         """Get random x coordinate, without going past screen edges"""
 
         # Use previous scent's x coord and add random -/+ num
-        scents = self.scene.get_sprite_list("Scents")
-        if len(scents) > 0:
-            previous_scent_x = scents[-1].center_x
+        previous_scent = self.scent_trail.newest()
+        if previous_scent is not None:
+            previous_scent_x = previous_scent.center_x
         else:
             previous_scent_x = c.MAIN_VIEW_WIDTH / 2
-        random_x_change = random.randint(-1 * c.SCENT_DELTA_X_MAX, c.SCENT_DELTA_X_MAX)
+        random_x_change = self.window.rng["scents"].randint(
+            -1 * c.SCENT_DELTA_X_MAX, c.SCENT_DELTA_X_MAX)
         x = previous_scent_x + random_x_change
 
         # If x past view edge, move other direction
@@ -202,86 +239,74 @@ class OutsideLeave(OutsideSection):
     def on_draw(self):
         """Draws outside scene"""
         self.view.clear()
-        arcade.draw_lrwh_rectangle_textured(0,
-                                            c.SCREEN_HEIGHT-c.MAIN_VIEW_HEIGHT,
-                                            c.MAIN_VIEW_WIDTH,
-                                            c.OUTSIDE_HEIGHT,
-                                            self.background)
+        self.background.draw()
+        self.camera.move_to(Vec2(0, self.camera_y), 1.0)
         self.camera.use()
         self.scene.draw()
 
     def on_key_press(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.up_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.down_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.right_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.left_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.ENTER]:
+        if key in [arcade.key.ENTER]:
             if c.DEBUG:
                 self.change_level(self.next_level)
         elif key in [arcade.key.BACKSPACE]:
             if c.DEBUG:
                 self.change_level(self.previous_level)
+        elif key in [c.PERF_OVERLAY_KEY, c.PERF_DUMP_KEY]:
+            if c.DEBUG:
+                self.view.on_profiler_key(key)
 
-    def on_update(self, delta_time: float):
+    def on_fixed_update(self, delta_time: float):
 
         if self.scent_has_reached_view_bottom():
-            self.change_level("home")
+            self.change_level(self.transitions["lost_trail"])
         elif self.camera_at_level_end():
-            self.change_level("foreign_hive")
+            self.change_level(self.next_level)
 
+        self.scent_timer.update(delta_time)
         self.handle_scent_collisions_with_player()
         self.update_all_sprites()
         self.physics_engine.update()
         self.camera_auto_scroll()
 
     def camera_at_level_end(self):
-        if self.camera_scroll_y >= c.OUTSIDE_HEIGHT - c.SCREEN_HEIGHT:
-            print("Changing levels...")
+        if self.camera_scroll_y >= self.background.height - c.SCREEN_HEIGHT:
             return True
         return False
 
     def change_level(self, level_name: str) -> None:
-        arcade.unschedule(self.place_scent_trail)
         self.view.change_level(level_name)
 
     def camera_auto_scroll(self):
-        """Auto scroll camera vertically"""
-        position = Vec2(0, self.camera_scroll_y)
+        """Auto scroll camera vertically (moved there in on_draw)"""
+        self.camera_y = self.camera_scroll_y
         self.camera_scroll_y += c.CAMERA_SPEED
-        self.camera.move_to(position, c.CAMERA_SPEED / 2)
+        self.background.update(self.camera_scroll_y)
 
     def update_all_sprites(self) -> None:
-        for sprite_list in self.scene.sprite_lists:
-            sprite_list.update()
+        for name in self.moving_sprite_lists:  # others don't move
+            self.scene[name].update()
         self.player.update_animation()
         self.enforce_screen_edge_for_sprite(self.player)
         self.show_next_scent()
 
     def show_next_scent(self) -> None:
-        scents = self.scene.get_sprite_list("Scents")
-        if len(scents) > 0:
-            scents[0].visible: Scent = True
+        scent = self.scent_trail.oldest()
+        if scent is not None:
+            scent.visible = True
 
     def handle_scent_collisions_with_player(self) -> None:
-        scent_collisions = arcade.check_for_collision_with_list(
-                self.player, self.scene.name_mapping["Scents"])
-        for scent in scent_collisions:
+        """Player collects the trail in order, one (visible) scent at a time"""
+        scent = self.scent_trail.oldest()
+        if scent is not None and arcade.check_for_collision(self.player,
+                                                            scent):
             scent.remove_from_sprite_lists()
+            self.scent_trail.pop()
 
     def scent_has_reached_view_bottom(self) -> bool:
-        for scent in self.scene.get_sprite_list("Scents"):
-            if scent.center_y < self.camera_scroll_y + c.INFO_BAR_HEIGHT:
-                return True
-        return False
+        scent = self.scent_trail.oldest()  # the oldest scent is the lowest
+        return scent is not None and \
+            scent.center_y < self.camera_scroll_y + c.INFO_BAR_HEIGHT
 
 
 class OutsideReturn(OutsideSection):
@@ -296,38 +321,48 @@ class OutsideReturn(OutsideSection):
                  **kwargs):
         super().__init__(left, bottom, width, height, **kwargs)
 
-        self.name = "outside_return"
+        self.moving_sprite_lists = ["Player", "Wasps"]  # lists needing update()
         self.scene = arcade.Scene()
         self.player: Player = self.window.player
         self.physics_engine = None
-        self.sounds = {
-            "hurt": arcade.load_sound("assets/sounds/hurt.wav"),
-            "honey": arcade.load_sound("assets/sounds/honey.wav"),
-            "background": arcade.load_sound(
-                "assets/sounds/background.wav", streaming=True),
-            "jump": arcade.load_sound("assets/sounds/jump.wav")
-        }
         self.camera = arcade.Camera(self.window.width, self.window.height, self.window)
 
-        self.previous_level = "foreign_hive"
-        self.next_level = "home"
+        self.wasp_timer = IntervalTimer(self.wasp_attack,
+                                        c.WASP_ATTACK_INTERVAL)
 
-        self.setup()
+    def setup_steps(self):
 
-    def setup(self):
-
-        self.background = arcade.load_texture(
-            c.OUTSIDE_FLIPPED, width=800, height=c.OUTSIDE_HEIGHT)
+        # Heading back home, so the same map is flown upside down
+        self.background = TiledBackground(c.OUTSIDE_IMAGE, mirrored=True)
+        self.background.update(self.camera_scroll_y)
+        yield
 
         # no walls used, but arcade physics engine seems to require this list
-        self.scene.add_sprite_list("Walls", use_spatial_hash=True)
-        self.scene.add_sprite_list("Wasps")
-        self.wasp_attacks_setup()
-        self.setup_key_press_state()
-        self.setup_player()
+        add_sprite_lists(self.scene, self.sprite_list_specs)
         self.physics_engine = arcade.PhysicsEngineSimple(
             self.player, self.scene.name_mapping["Walls"]
         )
+        yield
+
+        # Wasps are reused rather than made for every attack
+        self.wasp_pool = SpritePool(Wasp, self.spawns["wasps"])
+        yield
+
+    def reset_steps(self):
+        self.reset_camera()
+        for wasp in list(self.scene["Wasps"]):
+            self.remove_wasp(wasp)
+        yield
+
+    def enter(self) -> None:
+        self.wasp_attacks_setup()
+        self.setup_player()
+        super().enter()
+
+    def leave(self, next_level: str) -> None:
+        super().leave(next_level)
+        self.wasp_timer.stop()
+        self.background.unload()
 
     def setup_player(self) -> None:
         """Set player attributes and position for this level"""
@@ -343,116 +378,105 @@ class OutsideReturn(OutsideSection):
         self.player.angle = 0
         self.scene.add_sprite("Player", self.player)
 
-    def setup_key_press_state(self) -> None:
-        self.left_pressed = False
-        self.right_pressed = False
-        self.up_pressed = False
-        self.down_pressed = False
-
     def wasp_attacks_setup(self) -> None:
-        arcade.schedule(self.wasp_attack, c.WASP_ATTACK_INTERVAL)
+        self.wasp_timer.start()
 
     def wasp_attack(self, *args) -> None:
         """
         Generates wasp directly above player that will move directly toward
         the player (i.e. downwards from screen top) at a semi-random velocity
         """
-        print("wasp attack!")  # for debugging
         (player_x, player_y) = self.player.position
+        rng = self.window.rng["wasps"]
 
         # Randomly choose direction to attack from
-        direction = random.choice(["left", "right", "up", "down"])
+        direction = rng.choice(["left", "right", "up", "down"])
         if direction == "up":
-            wasp = Wasp(angle=180, position=(player_x, player_y+700))
-            wasp.change_y = -1 * random.randint(c.WASP_SPEED_MIN,
-                                                c.WASP_SPEED_MAX)
+            wasp = self.launch_wasp(angle=180,
+                                    position=(player_x, player_y+700),
+                                    change_y=-1 * rng.randint(
+                                        c.WASP_SPEED_MIN, c.WASP_SPEED_MAX))
         elif direction == "down":
-            wasp = Wasp(angle=0, position=(player_x, player_y-700))
-            wasp.change_y = random.randint(c.WASP_SPEED_MIN,
-                                           c.WASP_SPEED_MAX)
+            wasp = self.launch_wasp(angle=0,
+                                    position=(player_x, player_y-700),
+                                    change_y=rng.randint(
+                                        c.WASP_SPEED_MIN, c.WASP_SPEED_MAX))
         elif direction == "right":
-            wasp = Wasp(angle=90, position=(player_x+700, player_y))
-            wasp.change_x = -1 * random.randint(c.WASP_SPEED_MIN,
-                                                c.WASP_SPEED_MAX)
+            wasp = self.launch_wasp(angle=90,
+                                    position=(player_x+700, player_y),
+                                    change_x=-1 * rng.randint(
+                                        c.WASP_SPEED_MIN, c.WASP_SPEED_MAX))
         elif direction == "left":
-            wasp = Wasp(angle=270, position=(player_x-700, player_y))
-            wasp.change_x = random.randint(c.WASP_SPEED_MIN,
-                                           c.WASP_SPEED_MAX)
-        self.scene.add_sprite("Wasps", wasp)
+            wasp = self.launch_wasp(angle=270,
+                                    position=(player_x-700, player_y),
+                                    change_x=rng.randint(
+                                        c.WASP_SPEED_MIN, c.WASP_SPEED_MAX))
+        if wasp is None:  # every wasp in the pool is already attacking
+            return
 
         # Randomly add additional simultaneous, parallel attackers
-        if random.choice([1, 3]) == 3:
-            if wasp.angle == 180:  # if attacking from up direction
-                wasp2 = Wasp(angle=wasp.angle, change_y=wasp.change_y,
-                             position=(wasp.center_x-c.WASP_SPACING,
-                                       wasp.center_y))
-                wasp3 = Wasp(angle=wasp.angle, change_y=wasp.change_y,
-                             position=(wasp.center_x+c.WASP_SPACING,
-                                       wasp.center_y))
-            elif wasp.angle == 0:  # if attacking from up direction
-                wasp2 = Wasp(angle=wasp.angle, change_y=wasp.change_y,
-                             position=(wasp.center_x-c.WASP_SPACING,
-                                       wasp.center_y))
-                wasp3 = Wasp(angle=wasp.angle, change_y=wasp.change_y,
-                             position=(wasp.center_x+c.WASP_SPACING,
-                                       wasp.center_y))
-            elif wasp.angle == 90:  # if attacking from up direction
-                wasp2 = Wasp(angle=wasp.angle, change_x=wasp.change_x,
-                             position=(wasp.center_x,
-                                       wasp.center_y-c.WASP_SPACING))
-                wasp3 = Wasp(angle=wasp.angle, change_x=wasp.change_x,
-                             position=(wasp.center_x,
-                                       wasp.center_y+c.WASP_SPACING))
-            elif wasp.angle == 270:  # if attacking from up direction
-                wasp2 = Wasp(angle=wasp.angle, change_x=wasp.change_x,
-                             position=(wasp.center_x,
-                                       wasp.center_y-c.WASP_SPACING))
-                wasp3 = Wasp(angle=wasp.angle, change_x=wasp.change_x,
-                             position=(wasp.center_x,
-                                       wasp.center_y+c.WASP_SPACING))
-
-            self.scene.add_sprite("Wasps", wasp2)
-            self.scene.add_sprite("Wasps", wasp3)
-        print(f"Attacking wasp speed: {wasp.change_y}")
+        if rng.choice([1, 3]) == 3:
+            if wasp.angle in [0, 180]:  # attacking from up/down direction
+                offsets = [(-c.WASP_SPACING, 0), (c.WASP_SPACING, 0)]
+            else:  # attacking from left/right direction
+                offsets = [(0, -c.WASP_SPACING), (0, c.WASP_SPACING)]
+            for (offset_x, offset_y) in offsets:
+                self.launch_wasp(angle=wasp.angle,
+                                 position=(wasp.center_x + offset_x,
+                                           wasp.center_y + offset_y),
+                                 change_x=wasp.change_x,
+                                 change_y=wasp.change_y)
+
+    def launch_wasp(self, **launch_args):
+        """Takes a wasp from the pool and sends it flying (None if none)"""
+        wasp = self.wasp_pool.acquire()
+        if wasp is not None:
+            wasp.launch(**launch_args)
+            self.scene.add_sprite("Wasps", wasp)
+        return wasp
+
+    def remove_wasp(self, wasp: Wasp) -> None:
+        wasp.remove_from_sprite_lists()
+        self.wasp_pool.release(wasp)
+
+    def cull_wasps(self) -> None:
+        """Return wasps that have flown well out of view to the pool"""
+        bottom = self.camera_scroll_y - c.WASP_CULL_MARGIN
+        top = self.camera_scroll_y + c.SCREEN_HEIGHT + c.WASP_CULL_MARGIN
+        for wasp in list(self.scene["Wasps"]):
+            if not (bottom < wasp.center_y < top and
+                    -c.WASP_CULL_MARGIN < wasp.center_x <
+                    c.SCREEN_WIDTH + c.WASP_CULL_MARGIN):
+                self.remove_wasp(wasp)
 
     def on_draw(self):
         """Draws outside scene"""
         self.view.clear()
-        arcade.draw_lrwh_rectangle_textured(0,
-                                            c.SCREEN_HEIGHT-c.MAIN_VIEW_HEIGHT,
-                                            c.MAIN_VIEW_WIDTH,
-                                            c.OUTSIDE_HEIGHT,
-                                            self.background)
+        self.background.draw()
+        self.camera.move_to(Vec2(0, self.camera_y), 1.0)
         self.camera.use()
         self.scene.draw()
 
     def on_key_press(self, key: int, modifiers: int):
 
-        if key in [arcade.key.W, arcade.key.UP]:
-            self.up_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.S, arcade.key.DOWN]:
-            self.down_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.D, arcade.key.RIGHT]:
-            self.right_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.A, arcade.key.LEFT]:
-            self.left_pressed = True
-            self.update_player_speed()
-        elif key in [arcade.key.ENTER]:
+        if key in [arcade.key.ENTER]:
             if c.DEBUG:
                 self.change_level(self.next_level)
         elif key in [arcade.key.BACKSPACE]:
             if c.DEBUG:
                 self.change_level(self.previous_level)
+        elif key in [c.PERF_OVERLAY_KEY, c.PERF_DUMP_KEY]:
+            if c.DEBUG:
+                self.view.on_profiler_key(key)
 
-    def on_update(self, delta_time: float):
+    def on_fixed_update(self, delta_time: float):
 
         if self.camera_at_level_end():
             self.change_level(self.next_level)
 
+        self.wasp_timer.update(delta_time)
         self.handle_wasp_collisions_with_player()
+        self.cull_wasps()
         self.update_all_sprites()
         self.physics_engine.update()
         self.camera_auto_scroll()
@@ -460,13 +484,13 @@ class OutsideReturn(OutsideSection):
 
     def camera_at_level_end(self):
         # if self.camera_scroll_y >= c.SCREEN_HEIGHT:  # for DEBUG
-        if self.camera_scroll_y >= c.OUTSIDE_HEIGHT - c.SCREEN_HEIGHT:
+        if self.camera_scroll_y >= self.background.height - c.SCREEN_HEIGHT:
             return True
         return False
 
     def update_all_sprites(self) -> None:
-        for sprite_list in self.scene.sprite_lists:
-            sprite_list.update()
+        for name in self.moving_sprite_lists:  # others don't move
+            self.scene[name].update()
         for wasp in self.scene.name_mapping["Wasps"]:
             wasp.update_animation()
         self.player.update_animation()
@@ -486,11 +510,10 @@ class OutsideReturn(OutsideSection):
             self.player.hurt = False
 
     def change_level(self, level_name: str) -> None:
-        arcade.unschedule(self.wasp_attack)
         self.view.change_level(level_name)
 
     def camera_auto_scroll(self):
-        """Auto scroll camera vertically"""
-        position = Vec2(0, self.camera_scroll_y)
+        """Auto scroll camera vertically (moved there in on_draw)"""
+        self.camera_y = self.camera_scroll_y
         self.camera_scroll_y += c.CAMERA_SPEED
-        self.camera.move_to(position, c.CAMERA_SPEED / 2)
+        self.background.update(self.camera_scroll_y)
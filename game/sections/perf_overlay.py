@@ -0,0 +1,74 @@
+import arcade
+import game.constants as c
+from game.profiler import FrameProfiler
+
+
+class PerfOverlay(arcade.Section):
+    """
+    DEBUG overlay over the whole window: FPS, frame time histogram, sprite
+    counts of the current level's sprite lists and time per phase of the
+    frame (as measured by the game view's FrameProfiler)
+    """
+    def __init__(self, profiler: FrameProfiler, left: int = 0,
+                 bottom: int = 0, width: int = c.SCREEN_WIDTH,
+                 height: int = c.SCREEN_HEIGHT, **kwargs):
+        super().__init__(left, bottom, width, height,
+                         accept_keyboard_events=False, **kwargs)
+
+        self.name = "perf_overlay"
+        self.profiler = profiler
+        self.camera = arcade.Camera(self.window.width, self.window.height,
+                                    self.window)
+        self.since_refresh = c.PERF_OVERLAY_REFRESH  # refresh on first draw
+        self.stats_text = None  # made on first draw
+        self.histogram = []  # frame counts, see FrameProfiler.histogram
+
+    def on_update(self, delta_time: float):
+        self.since_refresh += delta_time
+
+    def on_draw(self):
+        if self.stats_text is None:
+            self.stats_text = arcade.Text("", start_x=10,
+                                          start_y=c.SCREEN_HEIGHT - 10,
+                                          color=arcade.color.LIME,
+                                          font_size=10, multiline=True,
+                                          width=300, anchor_y="top")
+        if self.since_refresh >= c.PERF_OVERLAY_REFRESH:
+            self.since_refresh = 0.
+            self.refresh()
+
+        self.camera.use()
+        arcade.draw_lrtb_rectangle_filled(0, 320, c.SCREEN_HEIGHT,
+                                          c.INFO_BAR_HEIGHT, (0, 0, 0, 160))
+        self.stats_text.draw()
+        self.draw_histogram()
+
+    def refresh(self) -> None:
+        """Update the text (not every frame, laying out text is slow)"""
+        lines = [f"FPS: {self.profiler.fps():.1f}", ""]
+        for phase, phase_time in sorted(
+                self.profiler.phase_averages().items()):
+            lines.append(f"{phase}: {phase_time * 1000:.2f}ms")
+        latency = self.view.controls.average_latency()
+        lines.append(f"input latency: {latency * 1000:.2f}ms")
+        lines.append("")
+        scene = self.view.current_level.scene
+        for name in scene.name_mapping:
+            lines.append(f"{name}: {len(scene[name])} sprites")
+        self.stats_text.text = "\n".join(lines)
+        self.histogram = self.profiler.histogram(c.PERF_HISTOGRAM_BOUNDS)
+
+    def draw_histogram(self) -> None:
+        """One bar per frame time bucket, fastest frames on the left"""
+        most = max(self.histogram, default=0)
+        if not most:
+            return
+        bar_width = 280 / len(self.histogram)
+        for bucket, count in enumerate(self.histogram):
+            if not count:
+                continue
+            left = 20 + bucket * bar_width
+            height = 100 * count / most
+            arcade.draw_lrtb_rectangle_filled(
+                left, left + bar_width - 4, c.INFO_BAR_HEIGHT + 10 + height,
+                c.INFO_BAR_HEIGHT + 10, arcade.color.LIME)
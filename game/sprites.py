@@ -1,13 +1,38 @@
 
 import arcade
 import game.constants as c
-import random
+from game.textures import load_texture, load_textures
+
+
+def add_sprite_list(scene: arcade.Scene, name: str,
+                    use_spatial_hash: bool = False, **kwargs) -> None:
+    """
+    Like scene.add_sprite_list(), but the list is lazy: its GPU buffers
+    are only made when it's first drawn, so levels can be set up (and run,
+    see headless.py) without an OpenGL context
+    """
+    sprite_list = arcade.SpriteList(use_spatial_hash=use_spatial_hash,
+                                    lazy=True, **kwargs)
+    # Not scene.add_sprite_list(name, sprite_list=...): it swaps an empty
+    # (so falsy) list for a new one, losing lazy and use_spatial_hash
+    scene.name_mapping[name] = sprite_list
+    scene.sprite_lists.append(sprite_list)
+
+
+def add_sprite_lists(scene: arcade.Scene, specs: list) -> None:
+    """
+    Adds a (lazy) sprite list for each spec, in drawing order. A spec is
+    the list's name plus any SpriteList arguments, e.g. from levels.json
+    """
+    for spec in specs:
+        arguments = dict(spec)
+        add_sprite_list(scene, arguments.pop("name"), **arguments)
 
 
 class Player(arcade.Sprite):
     def __init__(self, filename: str = c.PLAYER_SPRITE_IMAGE,
                  scaling: float = c.PLAYER_SPRITE_SCALING):
-        super().__init__(filename, scaling)
+        super().__init__(texture=load_texture(filename), scale=scaling)
 
         self.score = 0
         self.texture_index = 0  # tracks current texture
@@ -20,42 +45,11 @@ class Player(arcade.Sprite):
         # approx radius of the sprite (original pixel radius * scaling factor)
         self.radius = 16 * c.PLAYER_SPRITE_SCALING
 
-        # Setup and load walking animation textures
-        self.walking_textures = []
-        self.walking_texture_paths = [
-            "assets/sprites/bee_player_move1.png",
-            "assets/sprites/bee_player_move2.png"
-        ]
-
-        for filepath in self.walking_texture_paths:
-            self.walking_textures.append(arcade.load_texture(filepath))
-
-        # Setup and load flying animation textures
-        self.flying_textures = []
-        self.flying_texture_paths = [
-            "assets/sprites/bee_shadow1.png",
-            "assets/sprites/bee_shadow2.png"
-        ]
-        for filepath in self.flying_texture_paths:
-            self.flying_textures.append(arcade.load_texture(filepath))
-
-        # Setup and load hurt animation textures
-        self.hurt_textures = []
-        self.hurt_texture_paths = [
-            "assets/sprites/player_hurt1.png",
-            "assets/sprites/player_hurt2.png"
-        ]
-        for filepath in self.hurt_texture_paths:
-            self.hurt_textures.append(arcade.load_texture(filepath))
-
-        # Outside flying (scroll view) animation textures
-        self.outside_textures = []
-        self.outside_texture_paths = [
-            "assets/sprites/player_outside1.png",
-            "assets/sprites/player_outside2.png"
-        ]
-        for filepath in self.outside_texture_paths:
-            self.outside_textures.append(arcade.load_texture(filepath))
+        # Animation textures (shared by all instances via the texture cache)
+        self.walking_textures = load_textures(c.PLAYER_WALKING_IMAGES)
+        self.flying_textures = load_textures(c.PLAYER_FLYING_IMAGES)
+        self.hurt_textures = load_textures(c.PLAYER_HURT_IMAGES)
+        self.outside_textures = load_textures(c.PLAYER_OUTSIDE_IMAGES)
 
     def load_animations(self, file_list: list):
         pass
@@ -100,42 +94,25 @@ class Player(arcade.Sprite):
 
 
 class BeeEnemy(arcade.Sprite):
+    """Foreign hive bee (animated all together by a BeeCrowd, see crowd.py)"""
     def __init__(self, sprite, scaling):
-        super().__init__(sprite, scaling)
-
-        self.fluttering = False
-        self.frames = {
-                  "idle": arcade.load_texture(c.BEE_ENEMY_IMAGE),
-                  "moving1": arcade.load_texture(c.BEE_ENEMY_MOVING_1),
-                  "moving2": arcade.load_texture(c.BEE_ENEMY_MOVING_2),
-                  "moving3": arcade.load_texture(c.BEE_ENEMY_MOVING_3)
-                  }
-
-    def update_animation(self) -> None:
-        if self.fluttering:
-            self.texture = self.frames["moving2"]
-            self.fluttering = False
-        else:
-            self.texture = self.frames["idle"]
-            if random.randint(0, c.BEE_ROTATE_CHANCE) == c.BEE_ROTATE_CHANCE:
-                delta_angle = random.randrange(-45, 45)
-                self.angle = (self.angle + delta_angle) % 360
+        super().__init__(texture=load_texture(sprite), scale=scaling)
 
 
 class BeeFriend(arcade.Sprite):
     def __init__(self, sprite, scaling):
-        super().__init__(sprite, scaling)
+        super().__init__(texture=load_texture(sprite), scale=scaling)
 
 
 class Honey(arcade.Sprite):
     def __init__(self, sprite, scaling):
-        super().__init__(sprite, scaling)
+        super().__init__(texture=load_texture(sprite), scale=scaling)
 
 
 class Scent(arcade.Sprite):
     def __init__(self, sprite=c.SCENT_SPRITE_IMAGE,
                  scaling=c.SCENT_SPRITE_SCALING):
-        super().__init__(sprite, scaling)
+        super().__init__(texture=load_texture(sprite), scale=scaling)
 
     def update_animation(self):
         pass
@@ -144,7 +121,7 @@ class Scent(arcade.Sprite):
 class Wasp(arcade.Sprite):
     def __init__(self, sprite=c.WASP_IMAGE, scaling=c.WASP_SCALING,
                  change_y=0, change_x=0, position=(0, 0), angle=0):
-        super().__init__(sprite, scaling)
+        super().__init__(texture=load_texture(sprite), scale=scaling)
 
         self.change_y = change_y
         self.change_x = change_x
@@ -153,14 +130,18 @@ class Wasp(arcade.Sprite):
         self.frame = 0  # tracks frames for animations
         self.texture_index = 0  # tracks current texture
 
-        # Setup and load flying animation textures
-        self.flying_textures = []
-        self.flying_texture_paths = [
-            "assets/sprites/wasp_flying1.png",
-            "assets/sprites/wasp_flying2.png"
-        ]
-        for filepath in self.flying_texture_paths:
-            self.flying_textures.append(arcade.load_texture(filepath))
+        # Flying animation textures (shared via the texture cache)
+        self.flying_textures = load_textures(c.WASP_FLYING_IMAGES)
+
+    def launch(self, position, angle, change_x=0, change_y=0) -> None:
+        """(Re)start wasp flying, e.g. when it's taken from a SpritePool"""
+        self.position = position
+        self.angle = angle
+        self.change_x = change_x
+        self.change_y = change_y
+        self.frame = 0
+        self.texture_index = 0
+        self.texture = self.flying_textures[0]
 
     def update_animation(self) -> None:
 
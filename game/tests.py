@@ -1,6 +1,24 @@
 import unittest
-# import random
-# from game.py import *
+import importlib.util
+import os
+import random
+import tempfile
+from game.placement import SpritePlacer, PlacementError
+from game.crowd import BeeCrowd
+from game.pool import SpritePool
+from game.scent_trail import ScentTrail
+from game.rng import RandomStreams, randranges
+from game.timers import IntervalTimer
+from game.profiler import FrameProfiler, StartupProfile
+from game.interpolation import Interpolator
+from game.replay import Recording, PRESS, RELEASE
+from game.levels import LevelRegistry
+from game.loader import AssetLoader
+from game.controls import InputController, UP, LEFT
+
+
+# Tests of the game itself (rather than its pure modules) need arcade
+HAS_ARCADE = importlib.util.find_spec("arcade") is not None
 
 
 class TestCase(unittest.TestCase):
@@ -8,5 +26,358 @@ class TestCase(unittest.TestCase):
         self.assertEqual(True, True)
 
 
+class TestSpritePlacer(unittest.TestCase):
+    def test_placed_sprites_do_not_overlap(self):
+        placer = SpritePlacer(0, 0, 800, 600, seed=1)
+        circles = [placer.random_position(16) for _ in range(200)]
+        for i, (x1, y1) in enumerate(circles):
+            for (x2, y2) in circles[i+1:]:
+                self.assertGreaterEqual((x1 - x2) ** 2 + (y1 - y2) ** 2,
+                                        32 ** 2)
+
+    def test_same_seed_same_layout(self):
+        first = SpritePlacer(0, 0, 800, 600, seed=7)
+        second = SpritePlacer(0, 0, 800, 600, seed=7)
+        self.assertEqual([first.random_position(10) for _ in range(50)],
+                         [second.random_position(10) for _ in range(50)])
+
+    def test_non_obstacles_can_overlap(self):
+        placer = SpritePlacer(0, 0, 10, 10, seed=1)
+        for _ in range(100):
+            placer.random_position(50, obstacle=False)
+        self.assertEqual(placer.count, 0)
+
+    def test_full_area_raises(self):
+        placer = SpritePlacer(0, 0, 100, 100, attempts=20, seed=1)
+        placer.random_position(200)
+        with self.assertRaises(PlacementError):
+            placer.random_position(200)
+
+
+class Bee:
+    def __init__(self):
+        self.angle = 0
+        self.texture = "idle"
+
+
+class TestBeeCrowd(unittest.TestCase):
+    def test_turn_rate_matches_chance(self):
+        bees = [Bee() for _ in range(1000)]
+        crowd = BeeCrowd(bees, rotate_chance=9, turn=(1, 2),
+                         rng=random.Random(3))
+        for _ in range(100):
+            crowd.update()
+        turns = sum(bee.angle for bee in bees)  # each turn adds 1 degree
+        self.assertAlmostEqual(turns / (1000 * 100), 0.1, delta=0.01)
+
+    def test_flutter_lasts_one_update(self):
+        bees = [Bee() for _ in range(3)]
+        crowd = BeeCrowd(bees, rotate_chance=10 ** 9, idle_texture="idle",
+                         flutter_texture="flutter", rng=random.Random(1))
+        crowd.flutter(bees[:1])
+        crowd.update()
+        self.assertEqual([bee.texture for bee in bees],
+                         ["flutter", "idle", "idle"])
+        crowd.update()
+        self.assertEqual(bees[0].texture, "idle")
+
+
+class TestSpritePool(unittest.TestCase):
+    def test_capacity_and_reuse(self):
+        pool = SpritePool(Bee, 2)
+        first, second = pool.acquire(), pool.acquire()
+        self.assertIsNot(first, second)
+        self.assertIsNone(pool.acquire())  # exhausted, nothing new made
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(pool.in_use(), 2)
+        pool.release(second)
+        self.assertIs(pool.acquire(), second)
+
+
+class TestScentTrail(unittest.TestCase):
+    def test_oldest_first_and_wraps(self):
+        trail = ScentTrail(Bee, 3)
+        scents = [trail.push() for _ in range(3)]
+        self.assertIsNone(trail.push())  # full
+        self.assertIs(trail.pop(), scents[0])
+        self.assertIs(trail.push(), scents[0])  # sprite reused
+        self.assertEqual(list(trail), scents[1:] + scents[:1])
+        self.assertIs(trail.oldest(), scents[1])
+        self.assertIs(trail.newest(), scents[0])
+
+
+class TestRandomStreams(unittest.TestCase):
+    def test_streams_are_reproducible_and_independent(self):
+        first, second = RandomStreams(5), RandomStreams(5)
+        first["wasps"].random()  # shouldn't affect the other stream
+        self.assertEqual(randranges(first["bees"], 20, 0, 360),
+                         randranges(second["bees"], 20, 0, 360))
+        self.assertNotEqual(first["bees"].random(), first["wasps"].random())
+
+    def test_randranges_in_range(self):
+        values = randranges(random.Random(2), 1000, -45, 45)
+        self.assertTrue(all(-45 <= value < 45 for value in values))
+
+
+class TestIntervalTimer(unittest.TestCase):
+    def test_fires_per_interval_of_game_time(self):
+        calls = []
+        timer = IntervalTimer(calls.append, 1.)
+        timer.update(5.)  # not started yet
+        timer.start()
+        for _ in range(150):
+            timer.update(1 / 60)
+        self.assertEqual(len(calls), 2)
+        timer.stop()
+        timer.update(10.)
+        self.assertEqual(len(calls), 2)
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_times_watched_methods_only_while_enabled(self):
+        profiler = FrameProfiler()
+        bee = Bee()
+        turn = bee.turn = lambda: None
+        profiler.watch(bee, "turn", "turns")
+        profiler.watch(bee, "__init__", "bees")
+        self.assertIs(bee.turn, turn)  # disabled: not wrapped
+        profiler.toggle()
+        bee.turn()
+        profiler.end_frame(1 / 60)
+        self.assertEqual(set(profiler.frames[0][1]), {"turns"})
+        profiler.toggle()
+        self.assertIs(bee.turn, turn)
+        self.assertNotIn("__init__", vars(bee))
+        profiler.end_frame(1 / 60)
+        self.assertEqual(len(profiler.frames), 1)
+
+    def test_histogram_and_last_seconds(self):
+        profiler = FrameProfiler()
+        profiler.toggle()
+        for frame_time in [.01, .02, .05, .01]:
+            profiler.end_frame(frame_time)
+        self.assertEqual(profiler.histogram([1 / 60, 1 / 30]), [2, 1, 1])
+        self.assertEqual(len(profiler.last_seconds(.07)), 3)
+
+
+class TestStartupProfile(unittest.TestCase):
+    def test_phases_add_up(self):
+        profile = StartupProfile(start=0.)
+        profile.add("assets", .25)
+        with profile.phase("assets"):
+            pass
+        profile.add("setup", .5)
+        profile.mark("splash shown")
+        profile.mark("splash shown")  # only the first time counts
+        self.assertGreaterEqual(profile.phases["assets"], .25)
+        self.assertEqual(list(profile.phases), ["assets", "setup"])
+        self.assertEqual(list(profile.marks), ["splash shown"])
+        self.assertIn("setup: 500.0ms", profile.report())
+
+
+class TestInterpolator(unittest.TestCase):
+    def test_draws_between_steps_then_restores(self):
+        bee = Bee()
+        bee.position = (0., 0.)
+        interpolator = Interpolator()
+        interpolator.save([(bee, "position"), (bee, "angle")])
+        bee.position = (10., 20.)  # a step
+        bee.angle = 90
+        interpolator.apply(.25)
+        self.assertEqual(bee.position, (2.5, 5.))
+        self.assertEqual(bee.angle, 22.5)
+        interpolator.restore()
+        self.assertEqual((bee.position, bee.angle), ((10., 20.), 90))
+
+    def test_positions_set_as_lists(self):
+        bee = Bee()
+        bee.position = [0., 0.]
+        interpolator = Interpolator()
+        interpolator.save([(bee, "position")])
+        bee.position = [10., 20.]
+        interpolator.apply(.5)
+        self.assertEqual(bee.position, (5., 10.))
+
+
+class TestRecording(unittest.TestCase):
+    def test_save_and_load(self):
+        recording = Recording(42, "home", levels=[(0, "home")])
+        recording.add_event(3, PRESS, 100)
+        recording.add_event(9, RELEASE, 100)
+        recording.levels.append((20, "outside_leave"))
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "session.replay")
+            recording.save(path)
+            loaded = Recording.load(path)
+        self.assertEqual((loaded.seed, loaded.start_level), (42, "home"))
+        self.assertEqual(loaded.events, recording.events)
+        self.assertEqual(loaded.levels, recording.levels)
+        self.assertEqual(loaded.length(), 21)
+        self.assertEqual(loaded.events_by_step()[9], [(RELEASE, 100)])
+
+
+class TestLevelRegistry(unittest.TestCase):
+    def test_levels_lead_to_levels(self):
+        registry = LevelRegistry()
+        names = registry.names()
+        self.assertIn("home", names)
+        for name in names:
+            for next_level in registry.entries[name]["transitions"].values():
+                self.assertIn(next_level, names)
+        self.assertEqual(registry.classes, {})  # nothing imported yet
+
+    def test_set_spawns(self):
+        registry = LevelRegistry()
+        registry.set_spawns("foreign_hive", {"bees": 5})
+        self.assertEqual(registry.entries["foreign_hive"]["spawns"]["bees"],
+                         5)
+
+
+class TestAssetLoader(unittest.TestCase):
+    def test_decode_on_workers_then_finish(self):
+        finished = []
+
+        def finish(key, decoded):
+            finished.append(key)
+            return decoded.upper()
+
+        loader = AssetLoader(lambda key: key * 2, finish)
+        futures = loader.request_all(["a", "b", "c"])
+        self.assertEqual([future.result() for future in futures],
+                         ["aa", "bb", "cc"])
+        self.assertEqual(finished, [])  # only finished when asked
+        self.assertEqual(loader.get("b"), "BB")
+        self.assertEqual(loader.finish_ready(limit=1), 1)
+        self.assertFalse(loader.loaded(["a", "b", "c"]))
+        loader.finish_ready()
+        self.assertTrue(loader.loaded(["a", "b", "c"]))
+        self.assertEqual(loader.get("d"), "DD")  # not requested, no wait
+        self.assertEqual(sorted(finished), ["a", "b", "c", "d"])
+
+
+class TestInputController(unittest.TestCase):
+    def test_direction_from_keys(self):
+        controls = InputController({1: "up", 2: "up", 3: "left"})
+        changes = []
+        controls.subscribe(
+            lambda changed: changes.append(changed.direction))
+        self.assertTrue(controls.press(1))
+        controls.press(1)  # key repeat, no change
+        self.assertEqual((controls.pressed, controls.angle), (UP, 0))
+        controls.press(3)  # two directions held, player stops
+        self.assertEqual(controls.pressed, UP | LEFT)
+        controls.release(1)
+        self.assertFalse(controls.press(99))
+        self.assertEqual(changes, [(0, 1), (0, 0), (-1, 0)])
+        controls.moved()
+        self.assertEqual(len(controls.latencies), 1)
+        controls.clear()
+        self.assertFalse(controls.walking)
+
+
+@unittest.skipUnless(HAS_ARCADE, "needs arcade")
+class TestGameView(unittest.TestCase):
+    def test_setup_and_swap_level(self):
+        from game.headless import new_view
+        view = new_view(seed=1)
+        view.setup("home")
+        home = view.current_level
+        view.swap_level(home.next_level)
+        self.assertEqual(view.get_level_name(), home.next_level)
+        self.assertIs(view.current_level.view, view)
+        # only the current level hears about key changes
+        self.assertEqual(view.controls.subscribers,
+                         [view.current_level.on_controls_changed])
+
+    def test_full_hive_leaves_bees_out(self):
+        from game.headless import new_view
+        view = new_view(seed=1)
+        view.registry.set_spawns("home", {"bees": 1000})
+        with self.assertLogs("game.sections.hive", "WARNING"):
+            view.setup("home")
+        self.assertLess(len(view.current_level.scene["Bees"]), 1000)
+
+
+@unittest.skipUnless(HAS_ARCADE, "needs arcade")
+class TestHeadless(unittest.TestCase):
+    def test_runs_without_a_window(self):
+        from game.headless import run
+        levels = run(300, seed=1)
+        self.assertEqual(levels[0], (0, "home"))
+
+    def test_replay_takes_the_recorded_path(self):
+        import arcade
+        from game.headless import replay
+        recording = Recording(1, "home", events=[
+            (0, PRESS, arcade.key.ENTER), (1, RELEASE, arcade.key.ENTER),
+            (5, PRESS, arcade.key.D), (200, RELEASE, arcade.key.D)])
+        recording.levels = replay(recording)
+        self.assertEqual(recording.levels[-1][1], "outside_leave")
+        self.assertEqual(replay(recording), recording.levels)
+
+    def test_sprite_lists_keep_their_arguments(self):
+        from game.headless import new_view
+        view = new_view(seed=1)
+        view.setup("foreign_hive")
+        self.assertIsNotNone(view.current_level.scene["Bees"].spatial_hash)
+
+
+@unittest.skipUnless(HAS_ARCADE, "needs arcade")
+class TestBenchmarks(unittest.TestCase):
+    def test_short_scenario(self):
+        from game.benchmarks import run_scenario, compare, WALK
+        result = run_scenario("home", 30, {}, {}, WALK, seed=1)
+        self.assertEqual(result["frames"], 30)
+        self.assertIn("p95", result["update_ms"])
+        self.assertEqual(compare({"home": result}, {"home": result}, .2),
+                         [])
+
+
+class Atlas:
+    """Stand-in texture atlas: like arcade's, only rebuild() frees space"""
+    def __init__(self):
+        self.textures = []
+        self.used = 0  # textures' worth of space taken
+
+    def add(self, texture):
+        if texture not in self.textures:
+            self.textures.append(texture)
+            self.used += 1
+
+    def has_texture(self, texture):
+        return texture in self.textures
+
+    def remove(self, texture):
+        self.textures.remove(texture)
+
+    def rebuild(self):
+        self.used = len(self.textures)
+
+
+@unittest.skipUnless(HAS_ARCADE, "needs arcade")
+class TestBackgroundTiles(unittest.TestCase):
+    def test_atlas_space_is_reclaimed(self):
+        import arcade
+        import game.constants as c
+        from types import SimpleNamespace
+        from game.backgrounds import TiledBackground
+        from game.headless import HeadlessWindow
+        window = HeadlessWindow(seed=1)
+        atlas = Atlas()
+        window.ctx = SimpleNamespace(default_atlas=atlas)
+        arcade.set_window(window)
+        background = TiledBackground(c.OUTSIDE_IMAGE)
+        most_used = 0
+        for _ in range(30):  # loops of an outside level
+            for scroll_y in range(0, background.height, 64):
+                background.update(scroll_y)
+                for texture in background.tiles.textures.values():
+                    atlas.add(texture)  # as drawing does
+                most_used = max(most_used, atlas.used)
+            background.unload()
+        self.assertLessEqual(most_used, 4 * c.BACKGROUND_REBUILD_EVICTIONS)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+import arcade
+import game.constants as c
+from game.atlas import load_atlas_textures, decode_image
+from game.loader import AssetLoader
+import os
+
+
+# Every texture loaded by the game, keyed by (asset path, load parameters).
+# Shared by all sprites and sections, so each file is only decoded once.
+_textures = {}
+
+# Sprite textures cut from the atlas (see game/atlas.py), loaded on first use
+_atlas_textures = None
+
+# Images not in the atlas (e.g. backgrounds), decoded on worker threads
+_loader = AssetLoader(decode_image,
+                      lambda path, image: arcade.Texture(path, image=image))
+
+
+def texture_key(path: str, **params) -> tuple:
+    """Cache key for an asset path loaded with the given parameters"""
+    return (path, tuple(sorted(params.items())))
+
+
+def load_texture(path: str, **params) -> arcade.Texture:
+    """
+    Returns the texture for path, loading it from disk only on first use.
+    params are passed on to arcade.load_texture (e.g. width, height)
+    """
+    key = texture_key(path, **params)
+    texture = _textures.get(key)
+    if texture is None:
+        if not params:
+            texture = atlas_textures().get(path)
+            if texture is None:
+                texture = _loader.get(path)
+        else:
+            texture = arcade.load_texture(path, **params)
+        _textures[key] = texture
+    return texture
+
+
+def request_textures(paths: list) -> list:
+    """
+    Start decoding the images at paths on worker threads (those not in the
+    atlas or already loaded). Returns a future for each one decoding
+    """
+    return _loader.request_all([path for path in paths
+                                if path not in atlas_textures()
+                                and not is_loaded(path)])
+
+
+def finish_textures(limit: int = None) -> int:
+    """Make textures of up to limit decoded images (see request_textures)"""
+    return _loader.finish_ready(limit)
+
+
+def textures_loaded(paths: list) -> bool:
+    return _loader.loaded([path for path in paths
+                           if path not in atlas_textures()
+                           and not is_loaded(path)])
+
+
+def atlas_textures() -> dict:
+    """Sprite textures by path, cut from the atlas (built if out of date)"""
+    global _atlas_textures
+    if _atlas_textures is None:
+        _atlas_textures = load_atlas_textures()
+    return _atlas_textures
+
+
+def load_textures(paths: list, **params) -> list:
+    """Returns a list of (cached) textures, one for each path"""
+    return [load_texture(path, **params) for path in paths]
+
+
+def is_loaded(path: str, **params) -> bool:
+    return texture_key(path, **params) in _textures
+
+
+def texture_manifest() -> list:
+    """
+    Every sprite/background image path named in game/constants.py
+    (ignores paths of images that don't exist, and the tall backgrounds
+    that are streamed in tiles instead, see game/backgrounds.py)
+    """
+    paths = []
+    for name, value in vars(c).items():
+        if name.startswith("_"):
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for path in values:
+            if isinstance(path, str) and path.endswith(".png") \
+                    and path not in paths and os.path.exists(path) \
+                    and path not in c.STREAMED_BACKGROUNDS:
+                paths.append(path)
+    return paths
+
+
+def preload_textures(paths: list = None) -> None:
+    """Warm the texture cache (by default with every path in the manifest)"""
+    if paths is None:
+        paths = texture_manifest()
+    request_textures(paths)  # decode them all at once
+    for path in paths:
+        load_texture(path)
+
+
+def clear_texture_cache() -> None:
+    global _atlas_textures
+    _textures.clear()
+    _loader.clear()
+    _atlas_textures = None
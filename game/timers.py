@@ -0,0 +1,27 @@
+class IntervalTimer:
+    """
+    Calls callback(interval) every interval seconds of game time.
+    Unlike arcade.schedule(), time only passes when update() is called by
+    a section's on_fixed_update, so timers run at the game's (fixed,
+    possibly headless) pace and stop with their level.
+    """
+    def __init__(self, callback, interval: float):
+        self.callback = callback
+        self.interval = interval
+        self.elapsed = 0.
+        self.running = False
+
+    def start(self) -> None:
+        self.elapsed = 0.
+        self.running = True
+
+    def stop(self) -> None:
+        self.running = False
+
+    def update(self, delta_time: float) -> None:
+        if not self.running:
+            return
+        self.elapsed += delta_time
+        while self.running and self.elapsed >= self.interval:
+            self.elapsed -= self.interval
+            self.callback(self.interval)
@@ -1,11 +1,35 @@
-
 from game.sections.info_bar import InfoBar
 import arcade
-from game.sections.hive import HomeSection, ForeignHiveSection
-from game.sections.outside import OutsideLeave, OutsideReturn
+import game.constants as c
+from game.sections.fade import FadeSection
+from game.profiler import FrameProfiler
+from game.interpolation import Interpolator
+from game.controls import InputController
+from game.sections.input import InputSection
+from game.replay import Recording, PRESS
+from game.levels import LevelRegistry
+from game.textures import request_textures, finish_textures, \
+    textures_loaded
+from game.audio import request_sounds, sounds_loaded
+import itertools
+
+
+# Level methods timed by the profiler (when on), and the phase they're in
+PROFILED_METHODS = {
+    "on_fixed_update": "level update",
+    "handle_player_touching_honey": "collisions",
+    "handle_player_touching_bee": "collisions",
+    "handle_scent_collisions_with_player": "collisions",
+    "handle_wasp_collisions_with_player": "collisions",
+    "update_all_sprites": "sprite updates",
+    "camera_auto_scroll": "camera scroll",
+    "on_draw": "level draw"
+}
 
 
 class GameView(arcade.View):
+    show_info_bar = True  # False if there's nothing to draw it on
+
     def __init__(self):
         super().__init__()
 
@@ -13,32 +37,241 @@ class GameView(arcade.View):
         self.current_level = None
         self.intro_complete = False
 
-    def setup(self):
+        # Level changes fade out, swap sections (in one frame), then fade in
+        self.fade = None
+        self.fade_direction = 0  # 1 = fading out, -1 = fading in
+        self.pending_level = None  # level to change to once faded out
+
+        # What each level is made of (see levels.json)
+        self.registry = LevelRegistry()
+
+        # Levels already built, by name. Re-entering a level resets it
+        # rather than building a new section, scene and camera
+        self.levels = {}
+
+        # Next level, set up (or reset) a step per frame while current level
+        # runs: (name, section, setup steps)
+        self.prepared = None
+
+        self.info_bar = None
+
+        # Level logic runs in fixed steps: time not yet stepped, and what
+        # moved in the last step (drawn part way between steps)
+        self.accumulator = 0.
+        self.interpolator = Interpolator()
+        self.steps_run = 0
+        self.level_log = []  # (step, level name) of each level entered
+
+        # Directions held, kept across level changes (levels subscribe to
+        # it), and the section passing it key events
+        self.controls = InputController(c.MOVE_KEYS)
+        self.input_section = None
+
+        # Key events being recorded, or key events played back (by step)
+        self.key_recorder = None
+        self.replay_events = None
+
+        # Per-phase frame timings for the DEBUG performance overlay (only
+        # measured while the overlay is shown)
+        self.profiler = FrameProfiler(c.PERF_HISTORY_FRAMES)
+        self.perf_overlay = None  # made when first shown
+
+    def setup(self, level_name: str = "home"):
+
+        self.setup_overlays()
+        self.level_log.append((self.steps_run, level_name))
+        self.current_level = self.take_level(level_name)
+        self.add_level_sections()  # before enter(), which uses level.view
+        self.current_level.enter()
+        self.prepare_level(self.current_level.next_level)
+
+    def setup_overlays(self):
+        """Sections shown over every level"""
+        self.fade = FadeSection()
+        self.info_bar = InfoBar() if self.show_info_bar else None
+        self.input_section = InputSection(self.controls)
+
+    def record(self, recording: Recording) -> None:
+        """Note every key event in recording (call before setup)"""
+        from game.sections.key_recorder import KeyRecorder
+        self.key_recorder = KeyRecorder(recording)
+
+    def play(self, recording: Recording) -> None:
+        """
+        Feed recording's key events to the levels at the steps they were
+        made (call before setup, with the window's rng seeded as recorded)
+        """
+        self.replay_events = recording.events_by_step()
 
-        self.current_level = HomeSection()
+    def add_level_sections(self):
+        if self.key_recorder:  # first, to see keys before the level does
+            self.section_manager.add_section(self.key_recorder)
+        self.section_manager.add_section(self.input_section)
         self.section_manager.add_section(self.current_level)
-        self.section_manager.add_section(InfoBar())
+        if self.info_bar:
+            self.section_manager.add_section(self.info_bar)
+        self.section_manager.add_section(self.fade)
+        if self.profiler.enabled:
+            self.section_manager.add_section(self.perf_overlay)
+        self.watch_level()
 
-    def change_level(self, level: arcade.Section):
-        arcade.pause(0.5)
+    def watch_level(self) -> None:
+        """Have the profiler time the phases of the current level"""
+        self.profiler.unwatch_all()
+        level = self.current_level
+        for method_name, phase in PROFILED_METHODS.items():
+            if hasattr(level, method_name):
+                self.profiler.watch(level, method_name, phase)
+        if getattr(level, "physics_engine", None):
+            self.profiler.watch(level.physics_engine, "update", "physics")
+        if self.info_bar:
+            self.profiler.watch(self.info_bar, "on_draw", "info bar draw")
+
+    def on_profiler_key(self, key: int) -> None:
+        """Show/hide the performance overlay, or dump its recent timings"""
+        if key == c.PERF_OVERLAY_KEY:
+            if self.perf_overlay is None:  # not imported unless used
+                from game.sections.perf_overlay import PerfOverlay
+                self.perf_overlay = PerfOverlay(self.profiler)
+            self.profiler.toggle()
+            if self.profiler.enabled:
+                self.section_manager.add_section(self.perf_overlay)
+            else:
+                self.section_manager.remove_section(self.perf_overlay)
+        elif key == c.PERF_DUMP_KEY and self.profiler.enabled:
+            self.profiler.dump(c.PERF_DUMP_FILE, c.PERF_DUMP_SECONDS)
+
+    def change_level(self, level_name: str) -> None:
+        """Fade out of current level, then change to level_name"""
+        if self.fade_direction == 1:  # already leaving this level
+            return
+        self.pending_level = level_name
+        self.fade_direction = 1
+
+    def prepare_level(self, level_name: str) -> None:
+        """Start setting up (or resetting) a level, ahead of changing to it"""
+        level = self.levels.get(level_name)
+        if level:
+            steps = level.reset_steps()
+        else:
+            level = self.registry.new_level(level_name)
+            steps = itertools.chain(self.asset_steps(level_name),
+                                    level.setup_steps())
+        self.prepared = (level_name, level, steps)
+
+    def asset_steps(self, level_name: str):
+        """
+        Decode all a level's textures and sounds at once on worker threads,
+        then make textures of those decoded, a batch per step, until done
+        """
+        request_textures(self.registry.textures(level_name))
+        request_sounds(self.registry.sounds(level_name))
+        while not self.assets_loaded(level_name):
+            finish_textures(c.TEXTURE_BATCH_SIZE)
+            yield
+
+    def assets_loaded(self, level_name: str) -> bool:
+        return textures_loaded(self.registry.textures(level_name)) and \
+            sounds_loaded(self.registry.sounds(level_name))
+
+    def take_level(self, level_name: str) -> arcade.Section:
+        """
+        Returns level, ready to enter (using the prepared level if there is
+        one). Levels are only added to the pool once fully set up
+        """
+        if self.prepared and self.prepared[0] == level_name:
+            _, level, steps = self.prepared
+            for _ in steps:  # finish any setup left to do
+                pass
+        elif level_name in self.levels:
+            level = self.levels[level_name]
+            level.reset()
+        else:
+            level = self.registry.new_level(level_name)
+            for _ in self.asset_steps(level_name):
+                pass
+            level.setup()
+        self.prepared = None
+        self.levels[level_name] = level
+        return level
+
+    def swap_level(self, level_name: str) -> None:
+        self.interpolator.clear()  # don't draw sprites between the levels
+        self.level_log.append((self.steps_run, level_name))
+        self.current_level.leave(level_name)
+        level = self.take_level(level_name)
         self.section_manager.clear_sections()
-        if level == "home":
-            self.current_level = HomeSection()
-        elif level == "outside_leave":
-            self.current_level = OutsideLeave()
-        elif level == "foreign_hive":
-            self.current_level = ForeignHiveSection()
-        elif level == "outside_return":
-            self.current_level = OutsideReturn()
-        self.section_manager.add_section(self.current_level)
+        self.current_level = level
+        self.add_level_sections()  # before enter(), which uses level.view
+        self.current_level.enter()
+        self.prepare_level(self.current_level.next_level)
 
-        # Note: instantiating InfoBar each new level, because if same infobar
-        # object each level, major bugs for unknown reasons w/ arcade module
-        # TODO: figure out how to instantiate/use only one infobar for entire game
-        self.section_manager.add_section(InfoBar())
+    def on_update(self, delta_time: float):
+        """
+        Steps the game by FIXED_TIMESTEP as many times as fit in the time
+        passed (so it runs at the same speed at any frame rate), then puts
+        moving sprites part way to where the next step will take them
+        """
+        self.interpolator.restore()
+        self.accumulator += delta_time
+        steps = 0
+        while self.accumulator >= c.FIXED_TIMESTEP:
+            if steps == c.MAX_SUBSTEPS:  # too far behind, drop the rest
+                self.accumulator = 0.
+                break
+            self.interpolator.save(self.interpolated_attributes())
+            self.step(c.FIXED_TIMESTEP)
+            self.accumulator -= c.FIXED_TIMESTEP
+            steps += 1
+        self.interpolator.apply(self.accumulator / c.FIXED_TIMESTEP)
+
+        self.profiler.end_frame(delta_time)
+
+    def interpolated_attributes(self) -> list:
+        """(object, attribute) of everything drawn part way between steps"""
+        level = self.current_level
+        attributes = [(sprite, "position")
+                      for name in level.moving_sprite_lists
+                      for sprite in level.scene[name]]
+        if hasattr(level, "camera_y"):
+            attributes.append((level, "camera_y"))
+        return attributes
+
+    def step(self, delta_time: float) -> None:
+        """One fixed step of the current level, level changes and fades"""
+        if self.replay_events:
+            for (action, key) in self.replay_events.pop(self.steps_run, ()):
+                if action == PRESS:
+                    self.section_manager.on_key_press(key, 0)
+                else:
+                    self.section_manager.on_key_release(key, 0)
+
+        self.current_level.on_fixed_update(delta_time)
+        self.controls.moved()
+
+        if self.fade_direction == 1:
+            self.fade.alpha = min(255, self.fade.alpha + c.FADE_RATE)
+            if self.fade.alpha == 255:  # screen is black, change level
+                self.swap_level(self.pending_level)
+                self.pending_level = None
+                self.fade_direction = -1
+        elif self.fade_direction == -1:
+            self.fade.alpha = max(0, self.fade.alpha - c.FADE_RATE)
+            if self.fade.alpha == 0:
+                self.fade_direction = 0
+
+        if self.prepared:
+            next(self.prepared[2], None)
+
+        self.steps_run += 1
 
     def on_draw(self):
         self.clear()
 
+    def save_recording(self, path: str) -> None:
+        recording = self.key_recorder.recording
+        recording.levels = list(self.level_log)
+        recording.save(path)
+
     def get_level_name(self) -> str:
         return self.current_level.name
@@ -0,0 +1,51 @@
+import arcade
+import game.constants as c
+import time
+
+
+class SplashView(arcade.View):
+    """
+    Title screen shown while the game loads. Runs steps (a generator that
+    loads a piece at a time, yielding what it's loading) for up to
+    SPLASH_FRAME_BUDGET each frame, then calls on_loaded with the
+    generator's return value
+    """
+    def __init__(self, steps, on_loaded):
+        super().__init__()
+
+        self.name = "splash_view"
+        self.steps = steps
+        self.on_loaded = on_loaded
+        self.status = "Loading"
+        self.drawn = False  # nothing loads until the splash is on screen
+        self.title_text = None  # made on first draw
+        self.status_text = None
+
+    def on_update(self, delta_time: float):
+        if not self.drawn:
+            return
+        deadline = time.perf_counter() + c.SPLASH_FRAME_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                status = next(self.steps)
+            except StopIteration as loaded:
+                self.on_loaded(loaded.value)
+                return
+            if status:
+                self.status = status
+
+    def on_draw(self):
+        self.clear()
+        if self.title_text is None:
+            self.title_text = arcade.Text(c.GAME_TITLE, c.SCREEN_WIDTH / 2,
+                                          c.SCREEN_HEIGHT / 2,
+                                          arcade.color.GOLD, font_size=40,
+                                          anchor_x="center")
+            self.status_text = arcade.Text("", c.SCREEN_WIDTH / 2,
+                                           c.SCREEN_HEIGHT / 2 - 50,
+                                           arcade.color.WHITE, font_size=14,
+                                           anchor_x="center")
+        self.status_text.text = f"{self.status}..."
+        self.title_text.draw()
+        self.status_text.draw()
+        self.drawn = True